@@ -5,23 +5,28 @@ Add signal(s) to waveform display.
 Self-contained signal addition using controller infrastructure only.
 """
 
+import os
 import sys
 from pathlib import Path
 
 # Import from same directory
-sys.path.insert(0, str(Path(__file__).parent / "internal"))
-from modelsim_controller import ModelSimController
+_INTERNAL_DIR = str(Path(__file__).resolve().parent / "internal")
+sys.path.insert(0, _INTERNAL_DIR)
+from modelsim_controller import ModelSimController, get_project_root, normalize_signal_path
 
 
 def main():
     """Main entry point for add_wave CLI script."""
     if len(sys.argv) > 1 and sys.argv[1] in ['--help', '-h']:
-        print("Usage: add_wave.py [signal_path...]")
+        print("Usage: add_wave.py [-q] [signal_path...]")
         print()
         print("Arguments:")
         print("  signal_path  - Signal paths to add (optional)")
         print("                 If not specified, adds all signals recursively")
         print()
+        print("Options:")
+        print("  -q, --quiet  - Suppress progress output; emit single OK/ERR line")
+        print()
         print("IMPORTANT: Signal paths must NOT start with '/' (Git Bash issue)")
         print()
         print("Examples:")
@@ -30,15 +35,26 @@ def main():
         print('  python add_wave.py "counter_tb/clk" "counter_tb/reset"  # Add multiple')
         sys.exit(0)
 
-    signal_paths = sys.argv[1:] if len(sys.argv) > 1 else []
+    args = sys.argv[1:]
+    quiet = '-q' in args or '--quiet' in args
+    signal_paths = [a for a in args if a not in ('-q', '--quiet')]
+
+    # In quiet mode all progress output is dropped and a single status line
+    # is written with os.write, bypassing the TextIOWrapper encode/flush path
+    say = (lambda *a, **k: None) if quiet else print
+
+    def fail(msg):
+        if quiet:
+            os.write(1, f"ERR:{msg}\n".encode('utf-8'))
+        sys.exit(1)
 
-    # Get project root from current working directory
-    project_root = Path.cwd()
+    # Get project root (env override or current working directory)
+    project_root = get_project_root()
 
     if signal_paths:
-        print(f"⏳ Adding {len(signal_paths)} signal(s) to waveform...")
+        say(f"⏳ Adding {len(signal_paths)} signal(s) to waveform...")
     else:
-        print("⏳ Adding all signals to waveform...")
+        say("⏳ Adding all signals to waveform...")
 
     try:
         # Create controller
@@ -46,56 +62,92 @@ def main():
 
         # Connect to ModelSim
         if not controller.connect(max_retries=3, retry_delay=0.5):
-            print("✗ ERROR: Cannot connect to ModelSim socket server")
-            sys.exit(1)
+            say("✗ ERROR: Cannot connect to ModelSim socket server")
+            fail("cannot connect to ModelSim socket server")
 
         # Build TCL command
         if signal_paths:
-            # Add specific signals
-            for signal_path in signal_paths:
-                # Ensure signal path doesn't start with / (Git Bash issue)
-                if signal_path.startswith('/'):
-                    signal_path = signal_path[1:]
-
-                tcl_cmd = f"add wave /{signal_path}"
-                result = controller.execute_tcl(tcl_cmd)
-
-                if result['success']:
-                    print(f"  ✓ Added: {signal_path}")
-                else:
-                    print()
-                    error_msg = controller.analyze_error(result, context="waveform")
-                    print(error_msg)
-                    print()
+            # Add specific signals in canonical leading-slash form
+            signal_paths = [normalize_signal_path(p) for p in signal_paths]
+
+            # Batch all signals into one TCL script so N signals cost a single
+            # socket round-trip instead of N. Each add wave is wrapped in catch
+            # so one bad signal doesn't abort the rest; per-signal status is
+            # collected and returned as the script result (OK:path / ERR:path).
+            tcl_cmd = (
+                "set __status {}; "
+                "foreach __p {" + " ".join(f"{{{p}}}" for p in signal_paths) + "} { "
+                "if {[catch {add wave $__p}]} { lappend __status \"ERR:$__p\" } "
+                "else { lappend __status \"OK:$__p\" } }; "
+                "join $__status \\n"
+            )
+            result = controller.execute_tcl(tcl_cmd)
+
+            if not result['success']:
+                say()
+                error_msg = controller.analyze_error(result, context="waveform")
+                say(error_msg)
+                say()
+            else:
+                # Parse per-signal status from the batched result;
+                # buffer the report and emit it with one stdout write
+                # instead of one locked/flushed print per signal
+                report = []
+                failed = []
+                for line in str(result.get('output', '')).splitlines():
+                    line = line.strip()
+                    if line.startswith('OK:'):
+                        report.append(f"  ✓ Added: {line[4:]}")
+                    elif line.startswith('ERR:'):
+                        failed.append(line[5:])
+                        report.append(f"  ✗ Failed: {line[5:]}")
+
+                if failed:
+                    report.append("")
+                    report.append("Some signals could not be added:")
+                    report.append("  Run list_wave_signals.py to get exact signal names")
+                    report.append("")
+
+                if not quiet:
+                    sys.stdout.write("\n".join(report) + "\n")
         else:
-            # Add all signals recursively
-            tcl_cmd = "add wave -r /*"
+            # Add all signals recursively; the same round-trip returns the
+            # signal count as the script result, so no transcript read is
+            # needed to report what was added
+            tcl_cmd = "add wave -r /*; llength [find signals -r /*]"
             result = controller.execute_tcl(tcl_cmd)
 
             if not result['success']:
-                print()
+                say()
                 error_msg = controller.analyze_error(result, context="waveform")
-                print(error_msg)
+                say(error_msg)
                 controller.disconnect()
-                sys.exit(1)
+                fail("add wave -r /* failed")
 
-            print("  ✓ Added all signals recursively")
+            try:
+                count = int(str(result.get('output', '')).strip())
+                say(f"  ✓ Added all signals recursively ({count} signals)")
+            except ValueError:
+                say("  ✓ Added all signals recursively")
 
         # Disconnect
         controller.disconnect()
 
-        print()
-        print("✓ SUCCESS: Signals added to waveform")
+        if quiet:
+            os.write(1, b"OK\n")
+        else:
+            print()
+            print("✓ SUCCESS: Signals added to waveform")
         sys.exit(0)
 
     except KeyboardInterrupt:
-        print()
-        print("✗ Interrupted by user")
-        sys.exit(1)
+        say()
+        say("✗ Interrupted by user")
+        fail("interrupted")
     except Exception as e:
-        print()
-        print(f"✗ ERROR: {e}")
-        sys.exit(1)
+        say()
+        say(f"✗ ERROR: {e}")
+        fail(str(e))
 
 
 if __name__ == "__main__":
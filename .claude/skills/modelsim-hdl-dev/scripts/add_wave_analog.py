@@ -8,17 +8,28 @@ This script:
 3. Calculates min/max scale based on bit width and radix (signed/unsigned)
 4. Adds signal with proper analog format and scale
 
+Steps 1-4 run server-side as one fused TCL script (single socket
+round-trip). parse_bit_width/calculate_scale are the Python reference
+implementations of the same width/scale math.
+
 Only signals with explicit bit width patterns are supported.
 Integer and Real types are rejected due to unknown value ranges.
 """
 
+import argparse
+import os
 import sys
 import re
 from pathlib import Path
 
 # Import from same directory
-sys.path.insert(0, str(Path(__file__).parent / "internal"))
-from modelsim_controller import ModelSimController
+_INTERNAL_DIR = str(Path(__file__).resolve().parent / "internal")
+sys.path.insert(0, _INTERNAL_DIR)
+from modelsim_controller import ModelSimController, get_project_root, normalize_signal_path
+
+
+# Precompiled [N:M] pattern (avoids per-call re cache lookup)
+_BIT_WIDTH_RE = re.compile(r'\[(\d+):(\d+)\]')
 
 
 def parse_bit_width(desc_output):
@@ -40,7 +51,7 @@ def parse_bit_width(desc_output):
         "Real" → None
     """
     # Search for [N:M] pattern anywhere in the output
-    match = re.search(r'\[(\d+):(\d+)\]', desc_output)
+    match = _BIT_WIDTH_RE.search(desc_output)
 
     if not match:
         return None
@@ -74,10 +85,10 @@ def calculate_scale(bits, radix):
     """
     if radix == "unsigned":
         min_val = 0
-        max_val = (2 ** bits) - 1
+        max_val = (1 << bits) - 1
     else:  # signed
-        min_val = -(2 ** (bits - 1))
-        max_val = (2 ** (bits - 1)) - 1
+        min_val = -(1 << (bits - 1))
+        max_val = (1 << (bits - 1)) - 1
 
     return min_val, max_val
 
@@ -107,86 +118,79 @@ def extract_signal_name(signal_path):
     return signal_name
 
 
+def _positive_int(value):
+    """argparse converter: positive integer (for --height)."""
+    height = int(value)
+    if height <= 0:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return height
+
+
 def main():
     """Main entry point for add_wave_analog CLI script."""
-    if len(sys.argv) < 2 or sys.argv[1] in ['--help', '-h']:
-        print("Usage: add_wave_analog.py <signal_path> --radix <signed|unsigned> [--height <pixels>]")
-        print()
-        print("Add signal to waveform with analog display and auto-calculated scale.")
-        print()
-        print("Arguments:")
-        print("  signal_path  - Full hierarchical signal path (e.g., 'counter_tb/count')")
-        print("  --radix      - REQUIRED: 'signed' or 'unsigned'")
-        print("  --height     - Optional: Display height in pixels (default: 80)")
-        print()
-        print("IMPORTANT: Signal path must NOT start with '/' (Git Bash issue)")
-        print()
-        print("Examples:")
-        print('  python add_wave_analog.py "counter_tb/count" --radix unsigned')
-        print('  python add_wave_analog.py "adc_tb/sample" --radix signed --height 120')
-        print()
-        print("Supported signal types:")
-        print("  - Register [N:M] (e.g., Register [7:0])")
-        print("  - Wire [N:M] (e.g., Wire [15:0])")
-        print("  - Any type with explicit bit width pattern [N:M]")
-        print()
-        print("NOT supported:")
-        print("  - Integer (no bit width specification)")
-        print("  - Real (inappropriate for analog display)")
-        print()
-        print("Note: Signal is added with '_analog' suffix label to avoid conflicts")
-        sys.exit(0 if len(sys.argv) == 1 else 1)
-
-    # Parse arguments
-    signal_path = sys.argv[1]
-
-    # Parse optional arguments
-    radix = None
-    height = 80  # default
-
-    i = 2
-    while i < len(sys.argv):
-        if sys.argv[i] == '--radix':
-            if i + 1 >= len(sys.argv):
-                print("✗ ERROR: --radix requires a value")
-                sys.exit(1)
-            radix = sys.argv[i + 1].lower()  # Normalize case
-            i += 2
-        elif sys.argv[i] == '--height':
-            if i + 1 >= len(sys.argv):
-                print("✗ ERROR: --height requires a value")
-                sys.exit(1)
-            try:
-                height = int(sys.argv[i + 1])
-                if height <= 0:
-                    print("✗ ERROR: Height must be a positive integer")
-                    sys.exit(1)
-            except ValueError:
-                print(f"✗ ERROR: Invalid height value '{sys.argv[i + 1]}' (must be integer)")
-                sys.exit(1)
-            i += 2
-        else:
-            print(f"✗ ERROR: Unknown argument '{sys.argv[i]}'")
-            sys.exit(1)
-
-    # Validate radix (REQUIRED)
-    if radix is None:
-        print("✗ ERROR: Radix (signed/unsigned) is required for analog display")
-        print("  Use: --radix signed  or  --radix unsigned")
-        sys.exit(1)
-
-    if radix not in ['signed', 'unsigned']:
-        print(f"✗ ERROR: Invalid radix '{radix}'. Must be 'signed' or 'unsigned'")
+    parser = argparse.ArgumentParser(
+        description="Add signal to waveform with analog display and auto-calculated scale.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=(
+            "IMPORTANT: Signal path must NOT start with '/' (Git Bash issue)\n"
+            "\n"
+            "Examples:\n"
+            '  python add_wave_analog.py "counter_tb/count" --radix unsigned\n'
+            '  python add_wave_analog.py "adc_tb/sample" --radix signed --height 120\n'
+            "\n"
+            "Supported signal types:\n"
+            "  - Register [N:M] (e.g., Register [7:0])\n"
+            "  - Wire [N:M] (e.g., Wire [15:0])\n"
+            "  - Any type with explicit bit width pattern [N:M]\n"
+            "\n"
+            "NOT supported:\n"
+            "  - Integer (no bit width specification)\n"
+            "  - Real (inappropriate for analog display)\n"
+            "\n"
+            "Note: Signal is added with '_analog' suffix label to avoid conflicts"
+        )
+    )
+    parser.add_argument(
+        'signal_path',
+        help="Full hierarchical signal path (e.g., 'counter_tb/count')"
+    )
+    parser.add_argument(
+        '--radix', required=True, type=str.lower,
+        choices=['signed', 'unsigned'],
+        help="Signal interpretation for scale calculation (REQUIRED)"
+    )
+    parser.add_argument(
+        '--height', type=_positive_int, default=80,
+        help="Display height in pixels (default: 80)"
+    )
+    parser.add_argument(
+        '-q', '--quiet', action='store_true',
+        help="Suppress progress output; emit single OK/ERR line"
+    )
+
+    args = parser.parse_args()
+    signal_path = args.signal_path
+    radix = args.radix
+    height = args.height
+    quiet = args.quiet
+
+    # In quiet mode all progress output is dropped and a single status line
+    # is written with os.write, bypassing the TextIOWrapper encode/flush path
+    say = (lambda *a, **k: None) if quiet else print
+
+    def fail(msg):
+        if quiet:
+            os.write(1, f"ERR:{msg}\n".encode('utf-8'))
         sys.exit(1)
 
-    # Get project root from current working directory
-    project_root = Path.cwd()
+    # Get project root (env override or current working directory)
+    project_root = get_project_root()
 
-    print("⏳ Adding analog waveform...")
-    print(f"  Signal: {signal_path}")
-    print(f"  Radix: {radix}")
-    print(f"  Height: {height} pixels")
-    print()
+    say("⏳ Adding analog waveform...")
+    say(f"  Signal: {signal_path}")
+    say(f"  Radix: {radix}")
+    say(f"  Height: {height} pixels")
+    say()
 
     try:
         # Create controller
@@ -194,142 +198,110 @@ def main():
 
         # Connect to ModelSim
         if not controller.connect(max_retries=3, retry_delay=0.5):
-            print("✗ ERROR: Cannot connect to ModelSim socket server")
-            print("  Make sure ModelSim is running with: python scripts/start_modelsim_server.py")
-            sys.exit(1)
+            say("✗ ERROR: Cannot connect to ModelSim socket server")
+            say("  Make sure ModelSim is running with: python scripts/start_modelsim_server.py")
+            fail("cannot connect to ModelSim socket server")
 
-        print("Connected to ModelSim at localhost:12345")
+        say("Connected to ModelSim at localhost:12345")
 
         # Ensure signal path starts with / for describe command
-        full_path = signal_path if signal_path.startswith('/') else f"/{signal_path}"
+        full_path = normalize_signal_path(signal_path)
 
-        # Step 1: Get signal type using describe command
-        # Use echo to capture output (based on manual testing)
-        describe_cmd = f'set desc [describe {full_path}]; echo $desc'
-        result = controller.execute_tcl(describe_cmd)
-
-        # Disconnect
-        controller.disconnect()
-        print("Disconnected from ModelSim")
-        print()
-
-        # Check if describe command succeeded
-        if not result['success']:
-            print("✗ ERROR: Failed to get signal type information")
-            error_msg = controller.analyze_error(result, context="waveform")
-            print(error_msg)
-            print()
-            print("Possible causes:")
-            print("  - Signal does not exist")
-            print("  - Signal path is incorrect")
-            print("  - No simulation loaded")
-            sys.exit(1)
-
-        # Extract describe output from transcript
-        # The controller reads transcript, so we need to check the most recent output
-        transcript = controller.read_transcript(lines=10)
-
-        # Parse describe output from transcript
-        # Look for the echo output (should be after "echo $desc" line)
-        desc_output = None
-        lines = transcript.strip().split('\n')
-        for i, line in enumerate(lines):
-            if 'echo $desc' in line or 'echo \\$desc' in line:
-                # Next line should be the describe output
-                if i + 1 < len(lines):
-                    desc_output = lines[i + 1].strip()
-                    # Remove leading '#' if present (transcript format)
-                    if desc_output.startswith('#'):
-                        desc_output = desc_output[1:].strip()
-                    break
-
-        if not desc_output:
-            print("✗ ERROR: Could not extract signal type information")
-            print("  Transcript output:")
-            print(transcript)
-            sys.exit(1)
-
-        print(f"Signal type: {desc_output}")
-
-        # Step 2: Parse bit width
-        bits = parse_bit_width(desc_output)
-
-        if bits is None:
-            print()
-            print(f"✗ ERROR: Signal type '{desc_output}' not supported for analog display")
-            print("  No bit width [N:M] pattern found")
-            print()
-            print("Supported types:")
-            print("  - Register [N:M]")
-            print("  - Wire [N:M]")
-            print("  - Any type with explicit bit width specification")
-            print()
-            print("NOT supported:")
-            print("  - Integer (use digital display instead)")
-            print("  - Real (use digital display instead)")
-            sys.exit(1)
-
-        print(f"Bit width: {bits} bits")
-
-        # Step 3: Calculate min/max scale
-        min_val, max_val = calculate_scale(bits, radix)
-        print(f"Scale: min={min_val}, max={max_val} ({radix})")
-
-        # Step 4: Extract signal name and generate label
+        # Extract signal name and generate label
         signal_name = extract_signal_name(signal_path)
         label = f"{signal_name}_analog"
-        print(f"Label: {label}")
-        print()
-
-        # Step 5: Build add wave command with label
-        add_wave_cmd = (
-            f"add wave -label {label} "
-            f"-format Analog-Step "
-            f"-height {height} "
-            f"-min {min_val} "
-            f"-max {max_val} "
-            f"-radix {radix} "
-            f"{full_path}"
-        )
-
-        print(f"Executing: {add_wave_cmd}")
-        print()
 
-        # Reconnect to execute add wave
-        if not controller.connect(max_retries=3, retry_delay=0.5):
-            print("✗ ERROR: Cannot reconnect to ModelSim")
-            sys.exit(1)
+        # Fused describe + scale + add wave in a single TCL round-trip.
+        # Bit width and min/max are computed server-side from the describe
+        # result, so one exec_tcl call replaces the old describe / parse /
+        # add wave sequence. The script returns its final value:
+        #   "OK|<desc>|<bits>|<min>|<max>"  - signal added
+        #   "NOWIDTH|<desc>"                - no [N:M] pattern found
+        if radix == "unsigned":
+            scale_tcl = 'set __mn 0; set __mx [expr {(1 << $__b) - 1}]'
+        else:  # signed
+            scale_tcl = ('set __mn [expr {-(1 << ($__b - 1))}]; '
+                         'set __mx [expr {(1 << ($__b - 1)) - 1}]')
+
+        fused_cmd = (
+            f'set __d [describe {full_path}]; '
+            'if {[regexp {\\[(\\d+):(\\d+)\\]} $__d __ __n __m]} { '
+            'set __b [expr {abs($__n - $__m) + 1}]; '
+            f'{scale_tcl}; '
+            f'add wave -label {label} -format Analog-Step -height {height} '
+            f'-min $__mn -max $__mx -radix {radix} {full_path}; '
+            'set __r "OK|$__d|$__b|$__mn|$__mx" '
+            '} else { set __r "NOWIDTH|$__d" }; '
+            'set __r'
+        )
 
-        result = controller.execute_tcl(add_wave_cmd)
+        result = controller.execute_tcl(fused_cmd)
         controller.disconnect()
 
         if not result['success']:
-            print("✗ ERROR: Failed to add waveform")
+            say("✗ ERROR: Failed to add analog waveform")
             error_msg = controller.analyze_error(result, context="waveform")
-            print(error_msg)
-            sys.exit(1)
-
-        print("✓ SUCCESS: Analog waveform added!")
-        print(f"  Signal: {full_path}")
-        print(f"  Label: {label}")
-        print(f"  Scale: {min_val} to {max_val} ({radix})")
-        print(f"  Height: {height} pixels")
-        print()
-        print("Note: Signal appears as '{label}' in wave window")
-        print("      This allows both digital and analog views of same signal")
+            say(error_msg)
+            say()
+            say("Possible causes:")
+            say("  - Signal does not exist")
+            say("  - Signal path is incorrect")
+            say("  - No simulation loaded")
+            fail("failed to add analog waveform")
+
+        status = str(result.get('output', '')).strip().split('|')
+
+        if status[0] == 'NOWIDTH':
+            desc_output = status[1] if len(status) > 1 else '(unknown)'
+            say(f"✗ ERROR: Signal type '{desc_output}' not supported for analog display")
+            say("  No bit width [N:M] pattern found")
+            say()
+            say("Supported types:")
+            say("  - Register [N:M]")
+            say("  - Wire [N:M]")
+            say("  - Any type with explicit bit width specification")
+            say()
+            say("NOT supported:")
+            say("  - Integer (use digital display instead)")
+            say("  - Real (use digital display instead)")
+            fail("signal type not supported for analog display")
+
+        if status[0] != 'OK' or len(status) < 5:
+            say("✗ ERROR: Could not extract signal type information")
+            say(f"  Unexpected response: {result.get('output', '')}")
+            fail("unexpected response from ModelSim")
+
+        desc_output, bits, min_val, max_val = status[1], status[2], status[3], status[4]
+        say(f"Signal type: {desc_output}")
+        say(f"Bit width: {bits} bits")
+        say(f"Scale: min={min_val}, max={max_val} ({radix})")
+        say(f"Label: {label}")
+        say()
+
+        if quiet:
+            os.write(1, b"OK\n")
+        say("✓ SUCCESS: Analog waveform added!")
+        say(f"  Signal: {full_path}")
+        say(f"  Label: {label}")
+        say(f"  Scale: {min_val} to {max_val} ({radix})")
+        say(f"  Height: {height} pixels")
+        say()
+        say("Note: Signal appears as '{label}' in wave window")
+        say("      This allows both digital and analog views of same signal")
 
         sys.exit(0)
 
     except KeyboardInterrupt:
-        print()
-        print("✗ Interrupted by user")
-        sys.exit(1)
+        say()
+        say("✗ Interrupted by user")
+        fail("interrupted")
     except Exception as e:
-        print()
-        print(f"✗ ERROR: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+        say()
+        say(f"✗ ERROR: {e}")
+        if not quiet:
+            import traceback
+            traceback.print_exc()
+        fail(str(e))
 
 
 if __name__ == "__main__":
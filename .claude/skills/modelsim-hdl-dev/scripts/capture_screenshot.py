@@ -36,9 +36,22 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 
 # Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent / "internal"))
+_INTERNAL_DIR = str(Path(__file__).resolve().parent / "internal")
+sys.path.insert(0, _INTERNAL_DIR)
 
 from modelsim_client import ModelSimClient
+from modelsim_controller import get_project_root
+
+# Win32/PIL imports hoisted to module scope: repeated captures were
+# re-executing the import statements (importlib lock + cache lookup)
+# inside every helper call. Guarded so the module stays importable on
+# non-Windows machines.
+if sys.platform == 'win32':
+    import ctypes
+    import win32con
+    import win32gui
+    import win32ui
+    from PIL import Image
 
 
 # ==========================================
@@ -58,14 +71,30 @@ PANEL_WIDGET_PATHS = {
 # Helper Functions
 # ==========================================
 
+# Cached ModelSim parent HWND (EnumWindows walks every top-level window
+# on the desktop, so repeated captures should not redo the enumeration)
+_MODELSIM_HWND: Optional[int] = None
+
+
 def _find_modelsim_window() -> Optional[int]:
     """
     Find ModelSim parent window HWND
 
+    The HWND is cached after the first lookup; the cache is validated
+    with IsWindow + title check and refreshed only on miss (e.g. after
+    ModelSim was restarted).
+
     Returns:
         Parent window HWND or None if not found
     """
-    import win32gui
+    global _MODELSIM_HWND
+
+    # Fast path: validate cached HWND with a single Win32 call pair
+    if _MODELSIM_HWND is not None:
+        if win32gui.IsWindow(_MODELSIM_HWND) and \
+                "ModelSim" in win32gui.GetWindowText(_MODELSIM_HWND):
+            return _MODELSIM_HWND
+        _MODELSIM_HWND = None
 
     windows = []
 
@@ -77,12 +106,63 @@ def _find_modelsim_window() -> Optional[int]:
         return True
 
     win32gui.EnumWindows(callback, None)
-    return windows[0] if windows else None
+    _MODELSIM_HWND = windows[0] if windows else None
+    return _MODELSIM_HWND
+
+
+def _load_panel_hwnd_map(client: ModelSimClient) -> Dict[str, int]:
+    """
+    Fetch HWNDs for all known panels in one TCL round-trip
+
+    Tk widget HWNDs are stable once the panel exists, so the map is
+    cached on the client instance; multi-panel capture sessions pay a
+    single batched winfo id query instead of one round-trip per panel.
+
+    Args:
+        client: Connected ModelSimClient instance
+
+    Returns:
+        Dict mapping widget path -> HWND (panels that failed winfo id
+        are omitted)
+
+    Raises:
+        RuntimeError: If the batched Tcl command fails
+    """
+    cached = getattr(client, '_panel_hwnd_map', None)
+    if cached is not None:
+        return cached
+
+    widget_list = " ".join(PANEL_WIDGET_PATHS.values())
+    tcl_cmd = (
+        "set __ids {}; "
+        "foreach __w {" + widget_list + "} { "
+        "if {![catch {winfo id $__w} __id]} { lappend __ids \"$__w $__id\" } }; "
+        "join $__ids \\n"
+    )
+    result = client.execute_tcl(tcl_cmd)
+
+    if not result.get('success'):
+        raise RuntimeError(
+            f"Failed to get panel HWNDs: {result.get('message')}"
+        )
+
+    hwnd_map: Dict[str, int] = {}
+    for line in str(result.get('output', '')).splitlines():
+        parts = line.split()
+        if len(parts) == 2:
+            try:
+                # Tcl returns "0x12345" or decimal "74565"; base=0 handles both
+                hwnd_map[parts[0]] = int(parts[1], 0)
+            except ValueError:
+                continue
+
+    client._panel_hwnd_map = hwnd_map
+    return hwnd_map
 
 
 def _get_panel_hwnd_via_tcl(client: ModelSimClient, widget_path: str) -> int:
     """
-    Get panel HWND via Tcl winfo id command
+    Get panel HWND from the preloaded bulk map
 
     Args:
         client: Connected ModelSimClient instance
@@ -97,27 +177,14 @@ def _get_panel_hwnd_via_tcl(client: ModelSimClient, widget_path: str) -> int:
     if not client.is_connected():
         raise RuntimeError("Not connected to ModelSim")
 
-    # Execute Tcl command to get window ID
-    result = client.execute_tcl(f"winfo id {widget_path}")
+    hwnd_map = _load_panel_hwnd_map(client)
 
-    if not result.get('success'):
+    if widget_path not in hwnd_map:
         raise RuntimeError(
-            f"Failed to get HWND for {widget_path}: {result.get('message')}"
+            f"Failed to get HWND for {widget_path}: widget not found"
         )
 
-    # Parse HWND from output (should be decimal integer or hex)
-    try:
-        hwnd_str = result['output'].strip()
-        # Tcl returns in format like "0x12345" or decimal "74565"
-        if hwnd_str.startswith('0x'):
-            hwnd = int(hwnd_str, 16)
-        else:
-            hwnd = int(hwnd_str)
-        return hwnd
-    except (ValueError, KeyError) as e:
-        raise RuntimeError(
-            f"Failed to parse HWND from Tcl output '{result.get('output')}': {e}"
-        )
+    return hwnd_map[widget_path]
 
 
 def _capture_window_by_hwnd(hwnd: int, output_path: Path) -> Dict[str, Any]:
@@ -131,10 +198,12 @@ def _capture_window_by_hwnd(hwnd: int, output_path: Path) -> Dict[str, Any]:
     Returns:
         Dictionary with success, image, path, width, height
     """
-    import win32gui
-    import win32ui
-    import win32con
-    from PIL import Image
+    # PrintWindow flags: PW_RENDERFULLCONTENT (2) only. Adding
+    # PW_CLIENTONLY (1) would render just the client area into a
+    # bitmap sized from GetWindowRect, which includes borders and the
+    # title bar for the decorated top-level ModelSim window, leaving
+    # misaligned captures with garbage margins.
+    PW_FLAGS = 2
 
     try:
         # Get window dimensions
@@ -142,7 +211,6 @@ def _capture_window_by_hwnd(hwnd: int, output_path: Path) -> Dict[str, Any]:
         width = right - left
         height = bottom - top
 
-        # Capture using BitBlt
         hwnd_dc = win32gui.GetWindowDC(hwnd)
         mfc_dc = win32ui.CreateDCFromHandle(hwnd_dc)
         save_dc = mfc_dc.CreateCompatibleDC()
@@ -151,17 +219,33 @@ def _capture_window_by_hwnd(hwnd: int, output_path: Path) -> Dict[str, Any]:
         bitmap.CreateCompatibleBitmap(mfc_dc, width, height)
         save_dc.SelectObject(bitmap)
 
-        # Copy window contents
-        save_dc.BitBlt((0, 0), (width, height), mfc_dc, (0, 0), win32con.SRCCOPY)
+        # Ask the window to render itself into the memory DC. Unlike BitBlt
+        # from the window DC, PrintWindow works even when the panel is
+        # occluded or composited, so no raise/foreground dance is needed.
+        ok = ctypes.windll.user32.PrintWindow(hwnd, save_dc.GetSafeHdc(), PW_FLAGS)
+        if not ok:
+            # Fallback for windows that don't implement WM_PRINT properly
+            save_dc.BitBlt((0, 0), (width, height), mfc_dc, (0, 0), win32con.SRCCOPY)
 
         # Convert to PIL Image
         bmp_info = bitmap.GetInfo()
         bmp_bits = bitmap.GetBitmapBits(True)
-        img = Image.frombuffer(
-            'RGB',
-            (bmp_info['bmWidth'], bmp_info['bmHeight']),
-            bmp_bits, 'raw', 'BGRX', 0, 1
-        )
+        try:
+            # Zero-copy view of the BGRX buffer; the 2::-1 slice is a
+            # strided view (no fancy-index copy), so only one RGB buffer
+            # is materialized by fromarray instead of PIL's raw-decoder
+            # intermediate. Big panels are memory-bandwidth-bound here.
+            import numpy as np
+            arr = np.frombuffer(bmp_bits, dtype=np.uint8).reshape(
+                bmp_info['bmHeight'], bmp_info['bmWidth'], 4
+            )
+            img = Image.fromarray(arr[:, :, 2::-1], 'RGB')
+        except ImportError:
+            img = Image.frombuffer(
+                'RGB',
+                (bmp_info['bmWidth'], bmp_info['bmHeight']),
+                bmp_bits, 'raw', 'BGRX', 0, 1
+            )
 
         # Save
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -280,8 +364,8 @@ def main():
     target = sys.argv[1] if len(sys.argv) > 1 else 'wave'
     output_path = Path(sys.argv[2]) if len(sys.argv) > 2 else None
 
-    # Get project root (current working directory)
-    project_root = Path.cwd()
+    # Get project root (env override or current working directory)
+    project_root = get_project_root()
 
     print("="*60)
     print("ModelSim Screenshot Capture")
@@ -10,17 +10,64 @@ For analog display, use add_wave_analog.py instead.
 Self-contained format change using controller infrastructure only.
 """
 
+import argparse
+import json
+import os
 import sys
 from pathlib import Path
 
-# Import from same directory
-sys.path.insert(0, str(Path(__file__).parent / "internal"))
-from modelsim_controller import ModelSimController
+# Import from same directory (controller import itself is deferred to
+# the entry points so --help and usage errors never pay for it)
+_INTERNAL_DIR = str(Path(__file__).resolve().parent / "internal")
+if _INTERNAL_DIR not in sys.path:
+    sys.path.insert(0, _INTERNAL_DIR)
 
 
 # Format categories
 DIGITAL_FORMATS = ['binary', 'hex', 'unsigned', 'signed', 'octal', 'ascii']
-VALID_FORMATS = DIGITAL_FORMATS
+VALID_FORMATS = frozenset(DIGITAL_FORMATS)
+
+# Precomputed command templates: bound str.format methods assemble each
+# command in one C-level call instead of per-call f-string bytecode
+# (matters only in batch loops, but free everywhere)
+_PROPERTY_WAVE_RADIX = "property wave -radix {} {}".format
+_BATCH_STATUS_ITEM = (
+    "if {{[catch {{property wave -radix {0} {1}}}]}} "
+    "{{ lappend __status {{ERR:{1}}} }} "
+    "else {{ lappend __status {{OK:{1}}} }}"
+).format
+
+
+def resolve_partial_signal(project_root, name):
+    """
+    Resolve a bare signal name against the cached signal list.
+
+    list_wave_signals.py writes sim/.wave_signals.json; resolving a
+    partial name like 'count' against it avoids a ModelSim round-trip.
+    The cache is ignored when it is older than the transcript (the wave
+    window likely changed since it was written).
+
+    Args:
+        project_root: Project root Path
+        name: Bare signal name (no '/' in it)
+
+    Returns:
+        str: Unique matching full path, or None (missing/stale cache,
+             no match, or ambiguous match)
+    """
+    cache_file = Path(project_root) / "sim" / ".wave_signals.json"
+    transcript_file = Path(project_root) / "sim" / "transcript"
+    try:
+        cache_mtime = cache_file.stat().st_mtime
+        if transcript_file.exists() and transcript_file.stat().st_mtime > cache_mtime:
+            return None
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            signals = json.load(f).get("signals", [])
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    matches = [s for s in signals if s.rsplit('/', 1)[-1] == name]
+    return matches[0] if len(matches) == 1 else None
 
 
 def apply_digital_format(controller, signal_path, format_type):
@@ -35,56 +82,199 @@ def apply_digital_format(controller, signal_path, format_type):
     Returns:
         Result dict from execute_tcl
     """
-    tcl_cmd = f"property wave -radix {format_type} {signal_path}"
-    return controller.execute_tcl(tcl_cmd)
+    return controller.execute_tcl(_PROPERTY_WAVE_RADIX(format_type, signal_path))
+
+
+def apply_batch(controller, items):
+    """
+    Apply formats to many signals over one connection and one round-trip.
+
+    The socket protocol is strict request/response, so there is nothing
+    to overlap with threads; instead all property wave commands are
+    batched into a single TCL script (same pattern as add_wave.py) with
+    per-signal catch, and the per-signal OK:/ERR: status is parsed from
+    the script result.
+
+    Args:
+        controller: Connected ModelSimController instance
+        items: List of (signal_path, format_type) tuples, signal paths
+               already normalized and formats already validated
+
+    Returns:
+        Result dict from execute_tcl
+    """
+    parts = ["set __status {}"]
+    for signal_path, format_type in items:
+        parts.append(_BATCH_STATUS_ITEM(format_type, signal_path))
+    parts.append("join $__status \\n")
+    return controller.execute_tcl("; ".join(parts))
+
+
+def run_batch(batch_file, quiet):
+    """
+    Run --batch mode: read (signal, format) entries from a JSON file.
+
+    File format: [{"signal": "counter_tb/count", "format": "hex"}, ...]
+
+    Returns:
+        Process exit code (0 = all formats applied)
+    """
+    from modelsim_controller import ModelSimController, get_project_root, normalize_signal_path
+
+    say = (lambda *a, **k: None) if quiet else print
+
+    try:
+        with open(batch_file, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        say(f"✗ ERROR: Cannot read batch file '{batch_file}': {e}")
+        if quiet:
+            os.write(1, f"ERR:cannot read batch file: {e}\n".encode('utf-8'))
+        return 1
+
+    items = []
+    for entry in entries:
+        format_type = str(entry.get('format', '')).lower()
+        if format_type not in VALID_FORMATS:
+            say(f"✗ ERROR: Invalid format '{format_type}' for signal '{entry.get('signal')}'")
+            say(f"  Valid formats: {', '.join(DIGITAL_FORMATS)}")
+            if quiet:
+                os.write(1, f"ERR:invalid format '{format_type}'\n".encode('utf-8'))
+            return 1
+        items.append((normalize_signal_path(str(entry.get('signal', ''))), format_type))
+
+    if not items:
+        say("✗ ERROR: Batch file contains no entries")
+        if quiet:
+            os.write(1, b"ERR:empty batch file\n")
+        return 1
+
+    say(f"⏳ Changing format of {len(items)} signal(s)...")
+
+    controller = ModelSimController(get_project_root())
+    if not controller.connect(max_retries=3, retry_delay=0.5):
+        say("✗ ERROR: Cannot connect to ModelSim socket server")
+        if quiet:
+            os.write(1, b"ERR:cannot connect to ModelSim socket server\n")
+        return 1
+
+    result = apply_batch(controller, items)
+    controller.disconnect()
+
+    if not result['success']:
+        say()
+        say(controller.analyze_error(result, context="waveform"))
+        if quiet:
+            os.write(1, b"ERR:batch format change failed\n")
+        return 1
+
+    failed = 0
+    report = []
+    for line in str(result.get('output', '')).splitlines():
+        line = line.strip()
+        if line.startswith('OK:'):
+            report.append(f"  ✓ {line[3:]}")
+        elif line.startswith('ERR:'):
+            failed += 1
+            report.append(f"  ✗ {line[4:]}")
+
+    if not quiet:
+        sys.stdout.write("\n".join(report) + "\n")
+
+    if failed:
+        say()
+        say(f"✗ {failed} of {len(items)} format change(s) failed")
+        if quiet:
+            os.write(1, f"ERR:{failed} of {len(items)} failed\n".encode('utf-8'))
+        return 1
+
+    if quiet:
+        os.write(1, b"OK\n")
+    else:
+        print()
+        print(f"✓ SUCCESS: {len(items)} signal format(s) changed")
+    return 0
 
 
 def main():
     """Main entry point for change_wave_format CLI script."""
-    if len(sys.argv) < 3:
-        print("Usage: change_wave_format.py <signal_path> <format>")
-        print()
-        print("Arguments:")
-        print("  signal_path  - Full hierarchical signal path")
-        print("  format       - Display format (radix)")
-        print()
-        print("Formats:")
-        print(f"  Digital (radix): {', '.join(DIGITAL_FORMATS)}")
-        print()
-        print("IMPORTANT: Signal path must NOT start with '/' (Git Bash issue)")
-        print()
-        print("Examples:")
-        print('  python change_wave_format.py "counter_tb/count" "unsigned"')
-        print('  python change_wave_format.py "counter_tb/data" "hex"')
-        print('  python change_wave_format.py "counter_tb/addr" "binary"')
-        print()
-        print("For analog display:")
-        print('  Use add_wave_analog.py instead')
-        print('  python add_wave_analog.py "counter_tb/count" --radix unsigned')
-        print()
-        print("Best Practice:")
-        print("  1. Run list_wave_signals.py first to get exact signal names")
-        print("  2. Use the exact name from the list (without leading /)")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Change signal display format in waveform (digital radix only).",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=(
+            "IMPORTANT: Signal path must NOT start with '/' (Git Bash issue)\n"
+            "\n"
+            "Examples:\n"
+            '  python change_wave_format.py "counter_tb/count" "unsigned"\n'
+            '  python change_wave_format.py "counter_tb/data" "hex"\n'
+            '  python change_wave_format.py --batch formats.json\n'
+            "\n"
+            "Batch file format:\n"
+            '  [{"signal": "counter_tb/count", "format": "hex"}, ...]\n'
+            "\n"
+            "For analog display:\n"
+            "  Use add_wave_analog.py instead\n"
+            '  python add_wave_analog.py "counter_tb/count" --radix unsigned\n'
+            "\n"
+            "Best Practice:\n"
+            "  1. Run list_wave_signals.py first to get exact signal names\n"
+            "  2. Use the exact name from the list (without leading /)"
+        )
+    )
+    parser.add_argument(
+        'signal_path', nargs='?',
+        help="Full hierarchical signal path (e.g., 'counter_tb/count')"
+    )
+    parser.add_argument(
+        'format', nargs='?', type=str.lower, choices=DIGITAL_FORMATS,
+        help="Display format (radix)"
+    )
+    parser.add_argument(
+        '--batch', metavar='JSON',
+        help="Apply many formats from a JSON file in one connection/round-trip"
+    )
+    parser.add_argument(
+        '-q', '--quiet', action='store_true',
+        help="Suppress progress output; emit single OK/ERR line"
+    )
 
-    # Parse arguments
-    signal_path = sys.argv[1]
-    format_type = sys.argv[2].lower()
+    args = parser.parse_args()
+    quiet = args.quiet
 
-    # Validate format
-    if format_type not in VALID_FORMATS:
-        print(f"✗ ERROR: Invalid format '{format_type}'")
-        print(f"  Valid formats: {', '.join(VALID_FORMATS)}")
-        print()
-        print("For analog display, use add_wave_analog.py instead")
+    if args.batch is not None:
+        sys.exit(run_batch(args.batch, quiet))
+
+    if args.signal_path is None or args.format is None:
+        parser.error("signal_path and format are required (or use --batch)")
+
+    from modelsim_controller import ModelSimController, get_project_root, normalize_signal_path
+
+    signal_path = args.signal_path
+    format_type = args.format
+
+    # In quiet mode all progress output is dropped and a single status line
+    # is written with os.write, bypassing the TextIOWrapper encode/flush path
+    say = (lambda *a, **k: None) if quiet else print
+
+    def fail(msg):
+        if quiet:
+            os.write(1, f"ERR:{msg}\n".encode('utf-8'))
         sys.exit(1)
 
-    # Get project root from current working directory
-    project_root = Path.cwd()
+    # Get project root (env override or current working directory)
+    project_root = get_project_root()
 
-    print("⏳ Changing signal format...")
-    print(f"  Signal: {signal_path}")
-    print(f"  Format: {format_type}")
+    # Bare names (no hierarchy) are resolved against the cached signal
+    # list from list_wave_signals.py, skipping a simulator round-trip
+    if '/' not in signal_path:
+        resolved = resolve_partial_signal(project_root, signal_path)
+        if resolved is not None:
+            say(f"  Resolved '{signal_path}' → '{resolved}' (signal cache)")
+            signal_path = resolved
+
+    say("⏳ Changing signal format...")
+    say(f"  Signal: {signal_path}")
+    say(f"  Format: {format_type}")
 
     try:
         # Create controller
@@ -92,42 +282,44 @@ def main():
 
         # Connect to ModelSim
         if not controller.connect(max_retries=3, retry_delay=0.5):
-            print("✗ ERROR: Cannot connect to ModelSim socket server")
-            sys.exit(1)
+            say("✗ ERROR: Cannot connect to ModelSim socket server")
+            fail("cannot connect to ModelSim socket server")
 
-        print("Connected to ModelSim at localhost:12345")
+        say("Connected to ModelSim at localhost:12345")
 
         # Ensure signal path starts with / for property wave command
-        if not signal_path.startswith('/'):
-            signal_path = f"/{signal_path}"
+        signal_path = normalize_signal_path(signal_path)
 
         # Apply digital format
         result = apply_digital_format(controller, signal_path, format_type)
 
         # Disconnect
         controller.disconnect()
-        print("Disconnected from ModelSim")
+        say("Disconnected from ModelSim")
 
         # Check result
         if result['success']:
-            print()
-            print("✓ SUCCESS: Signal format changed")
-            print(f"  Signal '{signal_path}' is now displayed as {format_type}")
+            if quiet:
+                os.write(1, b"OK\n")
+            else:
+                print()
+                print("✓ SUCCESS: Signal format changed")
+                print(f"  Signal '{signal_path}' is now displayed as {format_type}")
             sys.exit(0)
         else:
-            print()
+            say()
             error_msg = controller.analyze_error(result, context="waveform")
-            print(error_msg)
-            sys.exit(1)
+            say(error_msg)
+            fail(f"format change failed for {signal_path}")
 
     except KeyboardInterrupt:
-        print()
-        print("✗ Interrupted by user")
-        sys.exit(1)
+        say()
+        say("✗ Interrupted by user")
+        fail("interrupted")
     except Exception as e:
-        print()
-        print(f"✗ ERROR: {e}")
-        sys.exit(1)
+        say()
+        say(f"✗ ERROR: {e}")
+        fail(str(e))
 
 
 if __name__ == "__main__":
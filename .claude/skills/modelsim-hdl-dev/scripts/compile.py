@@ -8,9 +8,9 @@ Self-contained compilation logic using controller infrastructure only.
 import sys
 from pathlib import Path
 
-# Import from same directory
+# Import from same directory (controller import itself is deferred to
+# main() so usage errors never pay for it)
 sys.path.insert(0, str(Path(__file__).parent / "internal"))
-from modelsim_controller import ModelSimController
 
 
 def main():
@@ -27,12 +27,14 @@ def main():
         print('  python compile.py "hdl/design/counter.v" "hdl/testbench/counter_tb.v" "counter_tb"')
         sys.exit(1)
 
+    from modelsim_controller import ModelSimController, get_project_root
+
     design_file = sys.argv[1]
     testbench_file = sys.argv[2]
     top_module = sys.argv[3]
 
-    # Get project root from current working directory
-    project_root = Path.cwd()
+    # Project root honors MODELSIM_PROJECT_ROOT (defaults to the CWD)
+    project_root = get_project_root()
 
     print(f"⏳ Compiling design...")
     print(f"  Design:    {design_file}")
@@ -51,28 +53,23 @@ def main():
             print('  Run: python .claude/skills/modelsim-hdl-dev/scripts/start_modelsim.py')
             sys.exit(1)
 
-        # Quit existing simulation first
-        print("⏳ Quitting existing simulation...")
-        controller.execute_tcl("quit -sim")
-
         # Normalize paths (Windows backslash → forward slash)
         design_path = controller.normalize_path(design_file)
         tb_path = controller.normalize_path(testbench_file)
 
-        # Compile design file
-        print("⏳ Compiling design file...")
-        result = controller.execute_tcl(f'vlog -work work {design_path}')
-
-        if not result['success']:
-            print()
-            error_msg = controller.analyze_error(result, context="compilation")
-            print(error_msg)
-            controller.disconnect()
-            sys.exit(1)
-
-        # Compile testbench
-        print("⏳ Compiling testbench...")
-        result = controller.execute_tcl(f'vlog -work work {tb_path}')
+        # Quit any existing simulation and compile both files with a single
+        # vlog invocation in one socket round-trip: vlog accepts multiple
+        # files and shares its parser setup across them, and this replaces
+        # three request/response cycles with one. The quit -sim is issued
+        # only when runStatus reports a loaded design, so the common
+        # first-compile-after-start case skips it entirely (still inside
+        # the same round-trip, guarded by catch for older ModelSim).
+        print("⏳ Compiling design and testbench...")
+        result = controller.execute_tcl(
+            f'if {{[catch {{runStatus}} __s] == 0 && $__s ne "nodesign"}} '
+            f'{{catch {{quit -sim}}}}; '
+            f'vlog -work work {design_path} {tb_path}'
+        )
 
         if not result['success']:
             print()
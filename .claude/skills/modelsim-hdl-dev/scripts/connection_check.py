@@ -8,9 +8,9 @@ This script checks if ModelSim is running and the socket server is accessible.
 import sys
 from pathlib import Path
 
-# Import from same directory
+# Import from same directory (controller import itself is deferred to
+# main() so --help never pays for it)
 sys.path.insert(0, str(Path(__file__).parent / "internal"))
-from modelsim_controller import ModelSimController
 
 
 def main():
@@ -22,8 +22,10 @@ def main():
         print("No arguments required.")
         sys.exit(0)
 
-    # Get project root from current working directory
-    project_root = Path.cwd()
+    from modelsim_controller import ModelSimController, get_project_root
+
+    # Project root honors MODELSIM_PROJECT_ROOT (defaults to the CWD)
+    project_root = get_project_root()
 
     print("⏳ Checking connection to ModelSim socket server...")
     print()
@@ -9,26 +9,48 @@ Use this for commands not covered by other CLI scripts.
 import sys
 from pathlib import Path
 
-# Import from same directory
+# Import from same directory (controller import itself is deferred to
+# main() so usage errors never pay for it)
 sys.path.insert(0, str(Path(__file__).parent / "internal"))
-from modelsim_controller import ModelSimController
 
 
 def main():
     """Main entry point for execute_tcl CLI script."""
-    if len(sys.argv) < 2:
-        print("Usage: execute_tcl.py <tcl_command>")
+    args = sys.argv[1:]
+    quiet = '-q' in args or '--quiet' in args
+    args = [a for a in args if a not in ('-q', '--quiet')]
+
+    # -c takes the command verbatim, preserving the caller's original
+    # quoting instead of the lossy ' '.join over argv words
+    tcl_command = None
+    if '-c' in args:
+        idx = args.index('-c')
+        if idx + 1 < len(args):
+            tcl_command = args[idx + 1]
+            args = args[:idx] + args[idx + 2:]
+
+    if tcl_command is None and args:
+        tcl_command = ' '.join(args)
+
+    if tcl_command is None:
+        print("Usage: execute_tcl.py [-q] <tcl_command>")
+        print("       execute_tcl.py [-q] -c \"<tcl_command>\"")
         print()
         print("Executes arbitrary TCL command in ModelSim.")
         print()
         print("Arguments:")
         print("  tcl_command  - Any valid ModelSim TCL command")
         print()
+        print("Options:")
+        print("  -c <cmd>     - Take the command as a single verbatim argument")
+        print("                 (preserves quoting; no argv re-joining)")
+        print("  -q, --quiet  - Print only the TCL result (for scripted loops)")
+        print()
         print("Examples:")
         print('  python execute_tcl.py "pwd"')
         print('  python execute_tcl.py "radix -hex /counter_tb/count"')
         print('  python execute_tcl.py "wave zoom range 100ns 500ns"')
-        print('  python execute_tcl.py "examine /counter_tb/count"')
+        print('  python execute_tcl.py -q -c "examine /counter_tb/count"')
         print()
         print("Use Cases:")
         print("  - Commands not covered by other CLI scripts")
@@ -36,15 +58,18 @@ def main():
         print("  - Advanced debugging operations")
         sys.exit(1)
 
-    # Get TCL command from arguments
-    tcl_command = ' '.join(sys.argv[1:])
+    from modelsim_controller import ModelSimController, get_project_root
+
+    # In quiet mode the banner/footer writes are suppressed; only the
+    # TCL result (or error) reaches stdout
+    say = (lambda *a, **k: None) if quiet else print
 
-    # Get project root from current working directory
-    project_root = Path.cwd()
+    # Project root honors MODELSIM_PROJECT_ROOT (defaults to the CWD)
+    project_root = get_project_root()
 
-    print(f"⏳ Executing TCL command...")
-    print(f"  Command: {tcl_command}")
-    print()
+    say(f"⏳ Executing TCL command...")
+    say(f"  Command: {tcl_command}")
+    say()
 
     try:
         # Create controller
@@ -63,23 +88,24 @@ def main():
 
         # Display result
         if result['success']:
-            print("✓ Command executed successfully")
-            print()
+            say("✓ Command executed successfully")
+            say()
 
-            # Show output if any
-            if 'result' in result and result['result']:
-                output = result['result'].strip()
+            # Show output if any (in quiet mode this is the only stdout
+            # write); the server returns the TCL value under 'output'
+            if result.get('output'):
+                output = result['output'].strip()
                 if output:
-                    print("Output:")
+                    say("Output:")
                     print(output)
-                    print()
+                    say()
 
             # Show warnings if any
             if 'warnings' in result and result['warnings']:
-                print("Warnings:")
+                say("Warnings:")
                 for warning in result['warnings']:
-                    print(f"  {warning}")
-                print()
+                    say(f"  {warning}")
+                say()
 
             sys.exit(0)
         else:
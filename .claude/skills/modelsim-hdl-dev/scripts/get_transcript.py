@@ -5,34 +5,124 @@ Read ModelSim transcript (simulation log).
 This script reads the transcript file directly without needing ModelSim connection.
 """
 
+import mmap
+import os
+import re
+import shutil
 import sys
 from pathlib import Path
 
+# Import from same directory (only for get_project_root; this script
+# never opens a ModelSim connection)
+sys.path.insert(0, str(Path(__file__).parent / "internal"))
+
+# One precompiled case-insensitive alternation classifies a line in a
+# single C-level scan; lines without markers (the vast majority) skip
+# the .lower() allocation and the four substring searches entirely
+_HIGHLIGHT_RE = re.compile(r'test_result:|\*\* error|\*\* warning', re.IGNORECASE)
+
+
+def read_last_n_lines(path, n):
+    """
+    Read the last n lines of a file without loading the whole file.
+
+    Memory-maps the file and scans backward for newline offsets with
+    mmap.rfind (a C-level scan over the kernel page cache), so only the
+    last page or two of the file are ever faulted in and no user-space
+    buffers are copied or concatenated. Long-running simulations can
+    leave transcripts of hundreds of MB; showing the last 50 lines
+    should not read all of it. Safe to call while ModelSim is still
+    appending: the mapping is read-only.
+
+    Args:
+        path: File path
+        n: Number of lines to return
+
+    Returns:
+        list[str]: Last n lines (fewer if the file is shorter)
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # Walk back over n+1 newlines (the extra one is the
+            # terminator of the line preceding the tail); pos ends up
+            # just before the first wanted line
+            pos = len(mm)
+            for _ in range(n + 1):
+                pos = mm.rfind(b'\n', 0, pos)
+                if pos < 0:
+                    break
+            tail = mm[pos + 1:]
+        finally:
+            mm.close()
+
+    lines = tail.decode('utf-8', errors='ignore').splitlines(keepends=True)
+    return lines[-n:]
+
 
 def highlight_line(line):
     """Add color/emphasis to important lines."""
-    line_lower = line.lower()
+    match = _HIGHLIGHT_RE.search(line)
+    if match is None:
+        return line
 
-    if 'test_result:' in line_lower:
+    marker = match.group(0).lower()
+    if marker == 'test_result:':
+        line_lower = line.lower()
         if 'pass' in line_lower:
             return f"✓ {line}"
         elif 'fail' in line_lower:
             return f"✗ {line}"
-    elif '** error' in line_lower:
+        return line
+    elif marker == '** error':
         return f"✗ {line}"
-    elif '** warning' in line_lower:
+    else:  # ** warning
         return f"⚠ {line}"
 
-    return line
+
+def dump_raw(path):
+    """
+    Stream the whole transcript to stdout without Python-level processing.
+
+    Uses os.sendfile on platforms that support it, so the bytes go
+    kernel-to-kernel without entering the Python heap; sendfile may
+    short-write (e.g. 64 KB at a time into a pipe), so it is looped on
+    the returned count until the whole file is sent. Falls back to
+    shutil.copyfileobj with a 1 MB buffer elsewhere (e.g. Windows, or
+    when stdout is not a regular fd target), resuming from however far
+    sendfile got.
+    """
+    sys.stdout.flush()
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(sys.stdout.fileno(), f.fileno(),
+                                   offset, size - offset)
+                if sent == 0:
+                    break  # EOF reached early (file shrank)
+                offset += sent
+        except (AttributeError, OSError):
+            f.seek(offset)
+            shutil.copyfileobj(f, sys.stdout.buffer, length=1 << 20)
+    sys.stdout.buffer.flush()
 
 
 def main():
     """Main entry point for get_transcript CLI script."""
     lines_to_show = 50  # Default
 
-    if len(sys.argv) > 1:
-        if sys.argv[1] in ['--help', '-h']:
-            print("Usage: get_transcript.py [lines]")
+    args = sys.argv[1:]
+    raw = '--raw' in args
+    args = [a for a in args if a != '--raw']
+
+    if args:
+        if args[0] in ['--help', '-h']:
+            print("Usage: get_transcript.py [lines] [--raw]")
             print()
             print("Reads ModelSim transcript file.")
             print()
@@ -40,13 +130,18 @@ def main():
             print("  lines  - Number of lines to show (default: 50)")
             print("          Use 'all' to show entire file")
             print()
+            print("Options:")
+            print("  --raw  - With 'all': stream the file unmodified (no")
+            print("           highlighting, no headers) via zero-copy I/O")
+            print()
             print("Examples:")
-            print('  python get_transcript.py        # Last 50 lines')
-            print('  python get_transcript.py 100    # Last 100 lines')
-            print('  python get_transcript.py all    # Entire file')
+            print('  python get_transcript.py            # Last 50 lines')
+            print('  python get_transcript.py 100        # Last 100 lines')
+            print('  python get_transcript.py all        # Entire file')
+            print('  python get_transcript.py all --raw  # Entire file, unprocessed')
             sys.exit(0)
 
-        arg = sys.argv[1].lower()
+        arg = args[0].lower()
         if arg == 'all':
             lines_to_show = None  # Show all
         else:
@@ -56,12 +151,13 @@ def main():
                     print("✗ ERROR: lines must be positive")
                     sys.exit(1)
             except ValueError:
-                print(f"✗ ERROR: Invalid argument '{sys.argv[1]}'")
+                print(f"✗ ERROR: Invalid argument '{args[0]}'")
                 print("  Expected: number or 'all'")
                 sys.exit(1)
 
-    # Get project root from current working directory
-    project_root = Path.cwd()
+    # Project root honors MODELSIM_PROJECT_ROOT (defaults to the CWD)
+    from modelsim_controller import get_project_root
+    project_root = get_project_root()
     transcript_file = project_root / "sim" / "transcript"
 
     # Check if file exists
@@ -75,37 +171,43 @@ def main():
         sys.exit(1)
 
     try:
-        # Read transcript
-        with open(transcript_file, 'r', encoding='utf-8', errors='ignore') as f:
-            all_lines = f.readlines()
-
-        if not all_lines:
-            print("✗ Transcript file is empty")
+        # Raw whole-file dump: no highlighting or headers, so the bytes
+        # never need to enter Python at all
+        if raw and lines_to_show is None:
+            dump_raw(transcript_file)
             sys.exit(0)
 
-        # Get lines to display
+        # Read transcript: whole file only when 'all' was requested,
+        # otherwise a backward block read of just the tail
         if lines_to_show is None:
-            lines = all_lines
-            print(f"=" * 60)
-            print(f"ModelSim Transcript (all {len(all_lines)} lines)")
-            print(f"=" * 60)
+            with open(transcript_file, 'r', encoding='utf-8', errors='ignore') as f:
+                lines = f.readlines()
+            total_desc = f"Total lines in file: {len(lines)}"
+            header = f"ModelSim Transcript (all {len(lines)} lines)"
         else:
-            lines = all_lines[-lines_to_show:]
-            print(f"=" * 60)
-            print(f"ModelSim Transcript (last {len(lines)} lines)")
-            print(f"=" * 60)
+            lines = read_last_n_lines(transcript_file, lines_to_show)
+            total_desc = f"Transcript size: {transcript_file.stat().st_size} bytes"
+            header = f"ModelSim Transcript (last {len(lines)} lines)"
+
+        if not lines:
+            print("✗ Transcript file is empty")
+            sys.exit(0)
+
+        print(f"=" * 60)
+        print(header)
+        print(f"=" * 60)
 
         print()
 
-        # Display with highlighting
-        for line in lines:
-            line = line.rstrip()
-            highlighted = highlight_line(line)
-            print(highlighted)
+        # Display with highlighting: join everything and write once
+        # instead of paying a locked, flushed print per line
+        sys.stdout.write(
+            '\n'.join(highlight_line(line.rstrip()) for line in lines) + '\n'
+        )
 
         print()
         print(f"=" * 60)
-        print(f"Total lines in file: {len(all_lines)}")
+        print(total_desc)
         print(f"=" * 60)
 
         sys.exit(0)
@@ -5,11 +5,46 @@ Author: Claude Code
 Date: 2026-01-14
 """
 
+import logging
+import random
+import select
 import socket
 import json
 import time
 from typing import Dict, List, Optional, Any
 
+# Library-style logging: disabled loggers short-circuit before any
+# string formatting or stdout flush, so tight ping/poll loops pay
+# nothing for diagnostics (print would flush per call and can block on
+# a slow terminal). Enable with logging.basicConfig(level=logging.INFO).
+logger = logging.getLogger("modelsim_client")
+
+# orjson parses/serializes directly between bytes and objects with a
+# SIMD-accelerated scanner (2-5x faster on large compile outputs, no
+# intermediate str); stdlib json is the fallback when it is not installed
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+
+# Pre-encoded message skeletons for the hottest commands: the fixed
+# framing is serialized once at import, so a ping costs zero encoding
+# and an exec_tcl only encodes its tcl_code string (polling loops issue
+# thousands of these)
+_PING_MSG = _json_dumps({"command": "ping", "params": {}}) + b"\n"
+_RESTART_MSG = _json_dumps({"command": "restart", "params": {}}) + b"\n"
+_WAVE_REFRESH_MSG = _json_dumps({"command": "wave_refresh", "params": {}}) + b"\n"
+_SHUTDOWN_MSG = _json_dumps({"command": "shutdown", "params": {}}) + b"\n"
+_EXEC_TCL_PREFIX = b'{"command": "exec_tcl", "params": {"tcl_code": '
+_EXEC_TCL_SUFFIX = b'}}\n'
+
 
 class ModelSimClient:
     """Client for communicating with ModelSim via TCP socket"""
@@ -21,13 +56,19 @@ class ModelSimClient:
         Args:
             host: Server hostname (default: localhost)
             port: Server port (default: 12345)
-            timeout: Socket timeout in seconds (default: 30.0)
+            timeout: Idle timeout in seconds — the longest the client
+                will wait without receiving any reply bytes (default: 30.0)
         """
         self.host = host
         self.port = port
         self.timeout = timeout
         self.socket: Optional[socket.socket] = None
+        self._rw = None  # Buffered file object wrapping the socket (writes)
+        self._recv_buf = b""  # Bytes received past the last reply line
         self._connected = False
+        # Wakeup pair for cancel(): a socketpair (not os.pipe) because
+        # Windows select() only accepts sockets
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
 
     def __enter__(self):
         """Context manager entry"""
@@ -36,40 +77,72 @@ class ModelSimClient:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
-        self.disconnect()
+        self.close()
 
-    def connect(self, max_retries: int = 10, retry_delay: float = 1.0) -> bool:
+    def connect(self, max_retries: int = 10, retry_delay: float = 1.0,
+                max_delay: float = 5.0) -> bool:
         """
         Connect to ModelSim socket server with retry logic
 
         Args:
             max_retries: Maximum number of connection attempts (default: 10)
-            retry_delay: Delay between retries in seconds (default: 1.0)
+            retry_delay: Initial delay between retries in seconds (default: 1.0)
+            max_delay: Cap on the exponential backoff in seconds
+                (default: 5.0); callers polling a server that is about
+                to come up can lower it to keep the tail sleeps short
 
         Returns:
             True if connected successfully, False otherwise
         """
         if self._connected:
-            print("Already connected")
+            logger.debug("Already connected")
             return True
 
         for attempt in range(max_retries):
             try:
-                self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                self.socket.settimeout(self.timeout)
-                self.socket.connect((self.host, self.port))
+                # create_connection owns the socket lifecycle (getaddrinfo,
+                # construct, timeout, connect, close-on-failure) so failed
+                # attempts don't leak half-configured sockets or FDs
+                self.socket = socket.create_connection(
+                    (self.host, self.port), timeout=self.timeout
+                )
+                # Commands are tiny request/reply payloads: disable Nagle so
+                # they flush immediately instead of waiting on a delayed ACK,
+                # and size the buffers generously for large compile output
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                # 1 MB covers the largest observed compile outputs, so a
+                # full response usually lands in one or two recv calls
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1024 * 1024)
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1024 * 1024)
+                # Long-lived connections (shell sessions) can sit idle
+                # between commands; keepalive detects a dead ModelSim
+                # side instead of blocking until the command timeout
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                # Buffered file wrapper for the write side: one
+                # write+flush per request. Replies are read with raw
+                # recv in _roundtrip so select() can observe every
+                # byte (a buffered reader would hide data from it)
+                self._rw = self.socket.makefile('wb', buffering=65536)
+                self._recv_buf = b""
                 self._connected = True
-                print(f"Connected to ModelSim at {self.host}:{self.port}")
+                logger.info("Connected to ModelSim at %s:%s", self.host, self.port)
                 return True
 
             except (ConnectionRefusedError, socket.timeout, OSError) as e:
                 if attempt < max_retries - 1:
-                    print(f"Connection attempt {attempt + 1}/{max_retries} failed: {e}")
-                    print(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
+                    # Exponential backoff (capped at max_delay) with up
+                    # to 25% jitter: a ModelSim still booting shouldn't
+                    # be hammered at a fixed rate, and jitter keeps
+                    # several scripts started together from retrying in
+                    # lockstep
+                    delay = min(retry_delay * (2 ** attempt), max_delay)
+                    delay += random.uniform(0, delay * 0.25)
+                    logger.info("Connection attempt %d/%d failed: %s", attempt + 1, max_retries, e)
+                    logger.info("Retrying in %s seconds...", delay)
+                    time.sleep(delay)
                 else:
-                    print(f"Failed to connect after {max_retries} attempts")
-                    print("Make sure ModelSim is running with socket server enabled")
+                    logger.warning("Failed to connect after %d attempts", max_retries)
+                    logger.warning("Make sure ModelSim is running with socket server enabled")
                     return False
 
         return False
@@ -78,13 +151,38 @@ class ModelSimClient:
         """Disconnect from ModelSim socket server"""
         if self.socket:
             try:
+                if self._rw is not None:
+                    self._rw.close()
                 self.socket.close()
             except Exception as e:
-                print(f"Error closing socket: {e}")
+                logger.warning("Error closing socket: %s", e)
             finally:
                 self.socket = None
+                self._rw = None
+                self._recv_buf = b""
                 self._connected = False
-                print("Disconnected from ModelSim")
+                logger.info("Disconnected from ModelSim")
+
+    def close(self):
+        """
+        Disconnect and release the cancel-wakeup socketpair
+
+        disconnect() deliberately keeps the wakeup pair so the client
+        can reconnect and still be cancellable; call close() when the
+        instance is being discarded for good, or its two wakeup FDs
+        leak (bounded by the connection pool in one-shot scripts, but
+        long-lived shells and retry paths accumulate them).
+        """
+        self.disconnect()
+        self._wakeup_r.close()
+        self._wakeup_w.close()
+
+    def __del__(self):
+        # Last-resort FD cleanup for instances dropped without close()
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def is_connected(self) -> bool:
         """Check if connected to server"""
@@ -105,42 +203,74 @@ class ModelSimClient:
             ConnectionError: If not connected to server
             TimeoutError: If server doesn't respond within timeout
         """
-        if not self._connected or not self.socket:
-            raise ConnectionError("Not connected to ModelSim server")
-
-        if params is None:
-            params = {}
-
         # Create command message
         message = {
             "command": command,
-            "params": params
+            "params": params or {}
         }
+        return self._roundtrip(_json_dumps(message) + b"\n", command)
 
+    def _roundtrip(self, payload: bytes, command: str) -> Dict[str, Any]:
+        """
+        Send one pre-framed request payload and parse its JSON reply
+
+        Shared by send_command and the pre-encoded fast paths (ping,
+        execute_tcl); payload must already include the trailing newline.
+        """
+        if not self._connected or not self.socket:
+            raise ConnectionError("Not connected to ModelSim server")
+
+        response_data = b""
         try:
-            # Send command as JSON
-            json_str = json.dumps(message)
-            self.socket.sendall((json_str + "\n").encode('utf-8'))
-
-            # Receive response
-            response_data = b""
-            while True:
-                chunk = self.socket.recv(4096)
-                if not chunk:
-                    raise ConnectionError("Server closed connection")
-                response_data += chunk
-                if b"\n" in response_data:
-                    break
-
-            # Parse JSON response
-            response_str = response_data.decode('utf-8').strip()
-            response = json.loads(response_str)
-
-            return response
+            # Send command as JSON through the buffered wrapper
+            # (TCP_NODELAY is set on connect, so the flush goes out
+            # immediately instead of waiting on Nagle)
+            self._rw.write(payload)
+            self._rw.flush()
+
+            # Read one newline-terminated reply line with an *idle*
+            # timeout: the clock restarts whenever bytes arrive, so a
+            # long-running but healthy command (a 45 s compile whose
+            # reply streams in late) is only killed after self.timeout
+            # seconds of true silence, not for exceeding a flat budget.
+            # Selecting in short slices keeps the wait interruptible
+            # from another thread via cancel()
+            last_activity = time.monotonic()
+            while b"\n" not in self._recv_buf:
+                remaining = self.timeout - (time.monotonic() - last_activity)
+                if remaining <= 0:
+                    raise socket.timeout()
+                readable, _, _ = select.select(
+                    [self.socket, self._wakeup_r], [], [], min(remaining, 1.0)
+                )
+                if self._wakeup_r in readable:
+                    self._wakeup_r.recv(4096)  # drain the wakeup byte(s)
+                    # The server will still send this command's reply;
+                    # drop the connection so the orphaned reply can
+                    # never be read as the answer to a later command
+                    self.disconnect()
+                    raise ConnectionError(f"Command '{command}' cancelled")
+                if readable:
+                    chunk = self.socket.recv(65536)
+                    if not chunk:
+                        raise ConnectionError("Server closed connection")
+                    self._recv_buf += chunk
+                    last_activity = time.monotonic()
+
+            response_data, _, self._recv_buf = self._recv_buf.partition(b"\n")
+
+            # Parse JSON straight from the bytes (both parsers accept
+            # bytes, with or without a trailing newline)
+            return _json_loads(response_data)
 
         except socket.timeout:
-            raise TimeoutError(f"Command '{command}' timed out after {self.timeout} seconds")
-        except json.JSONDecodeError as e:
+            # Same orphaned-reply hazard as cancel(): if the reply does
+            # arrive later it must not be matched to the next command
+            self.disconnect()
+            raise TimeoutError(
+                f"Command '{command}' got no data for {self.timeout} seconds"
+            )
+        except ValueError as e:
             return {
                 "success": False,
                 "message": f"Failed to parse server response: {e}",
@@ -157,6 +287,23 @@ class ModelSimClient:
                 "warnings": []
             }
 
+    def cancel(self):
+        """
+        Abort a command currently waiting for its reply
+
+        Safe to call from another thread: writes a wakeup byte that the
+        select() in _roundtrip observes, making the pending command fail
+        with a 'cancelled' communication error instead of blocking until
+        timeout. The connection is closed as a side effect — the server
+        still sends the cancelled command's reply, and leaving it unread
+        on an open connection would hand it to the next command — so the
+        next use must reconnect.
+        """
+        try:
+            self._wakeup_w.send(b'x')
+        except OSError:
+            pass
+
     def ping(self) -> bool:
         """
         Ping server to check if it's alive
@@ -165,10 +312,10 @@ class ModelSimClient:
             True if server responds, False otherwise
         """
         try:
-            response = self.send_command("ping")
+            response = self._roundtrip(_PING_MSG, "ping")
             return response.get("success", False)
         except Exception as e:
-            print(f"Ping failed: {e}")
+            logger.debug("Ping failed: %s", e)
             return False
 
     def recompile(self, design_files: List[str], testbench_file: str = "") -> Dict[str, Any]:
@@ -182,11 +329,14 @@ class ModelSimClient:
         Returns:
             Response dictionary with compilation results
         """
+        # Single-pass separator translation straight into the params
+        # list: plain str.replace per path (no Path objects), and the
+        # ready-built list serializes contiguously as one JSON array
         params = {
-            "design_files": design_files
+            "design_files": [p.replace("\\", "/") for p in design_files]
         }
         if testbench_file:
-            params["testbench_file"] = testbench_file
+            params["testbench_file"] = testbench_file.replace("\\", "/")
 
         return self.send_command("recompile", params)
 
@@ -197,7 +347,7 @@ class ModelSimClient:
         Returns:
             Response dictionary
         """
-        return self.send_command("restart")
+        return self._roundtrip(_RESTART_MSG, "restart")
 
     def run_simulation(self, time: str) -> Dict[str, Any]:
         """
@@ -219,7 +369,7 @@ class ModelSimClient:
         Returns:
             Response dictionary
         """
-        return self.send_command("wave_refresh")
+        return self._roundtrip(_WAVE_REFRESH_MSG, "wave_refresh")
 
     def execute_tcl(self, tcl_code: str) -> Dict[str, Any]:
         """
@@ -231,8 +381,24 @@ class ModelSimClient:
         Returns:
             Response dictionary with command output
         """
-        params = {"tcl_code": tcl_code}
-        return self.send_command("exec_tcl", params)
+        # Splice the encoded tcl_code into the pre-encoded skeleton:
+        # no per-call dict construction or full-message serialization
+        return self._roundtrip(
+            _EXEC_TCL_PREFIX + _json_dumps(tcl_code) + _EXEC_TCL_SUFFIX,
+            "exec_tcl"
+        )
+
+    def execute_tcl_batch(self, tcl_commands: List[str]) -> Dict[str, Any]:
+        """
+        Execute several TCL commands in one request/response round-trip
+
+        Args:
+            tcl_commands: TCL commands in execution order (joined with ';')
+
+        Returns:
+            Response dictionary (reflects the combined script's outcome)
+        """
+        return self.execute_tcl("; ".join(tcl_commands))
 
     def get_wave_geometry(self) -> Dict[str, Any]:
         """
@@ -251,7 +417,7 @@ class ModelSimClient:
         Returns:
             Response dictionary
         """
-        response = self.send_command("shutdown")
+        response = self._roundtrip(_SHUTDOWN_MSG, "shutdown")
         self._connected = False
         return response
 
@@ -262,29 +428,127 @@ class ModelSimClient:
         Args:
             response: Response dictionary
         """
+        # Accumulate and write once: one syscall instead of one per line
         if response.get("success"):
-            print(f"✓ SUCCESS: {response.get('message', 'Command completed')}")
+            lines = [f"✓ SUCCESS: {response.get('message', 'Command completed')}"]
         else:
-            print(f"✗ FAILED: {response.get('message', 'Command failed')}")
+            lines = [f"✗ FAILED: {response.get('message', 'Command failed')}"]
 
-        # Print output
         output = response.get("output", "")
         if output:
-            print(f"\nOutput:\n{output}")
+            lines.append(f"\nOutput:\n{output}")
 
-        # Print errors
         errors = response.get("errors", [])
         if errors:
-            print("\nErrors:")
-            for error in errors:
-                print(f"  - {error}")
+            lines.append("\nErrors:")
+            lines.extend(f"  - {error}" for error in errors)
 
-        # Print warnings
         warnings = response.get("warnings", [])
         if warnings:
-            print("\nWarnings:")
-            for warning in warnings:
-                print(f"  - {warning}")
+            lines.append("\nWarnings:")
+            lines.extend(f"  - {warning}" for warning in warnings)
+
+        print("\n".join(lines))
+
+
+class AsyncModelSimClient:
+    """
+    Asyncio variant of ModelSimClient for pipelining independent commands
+
+    The blocking client serializes every flow; with several async
+    clients (one connection each - the server services each connection
+    via its own fileevent), independent commands such as a
+    get_wave_geometry query during a long run_simulation overlap, so N
+    independent queries cost max(latency) instead of the sum.
+
+    Usage:
+        client = AsyncModelSimClient()
+        await client.connect()
+        results = await asyncio.gather(
+            client.execute_tcl("examine /tb/a"),
+            other_client.execute_tcl("examine /tb/b"),
+        )
+        await client.disconnect()
+
+    asyncio is imported inside the coroutines: every CLI script imports
+    this module, but only async callers (already inside an event loop)
+    ever pay the asyncio import cost.
+    """
+
+    def __init__(self, host: str = "localhost", port: int = 12345, timeout: float = 30.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._reader: Optional["asyncio.StreamReader"] = None
+        self._writer: Optional["asyncio.StreamWriter"] = None
+
+    async def connect(self) -> bool:
+        """Open the connection (no retry loop; wrap in asyncio.wait_for/retry as needed)"""
+        import asyncio
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout
+            )
+            sock = self._writer.get_extra_info('socket')
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            return True
+        except (OSError, asyncio.TimeoutError):
+            self._reader = self._writer = None
+            return False
+
+    async def disconnect(self):
+        """Close the connection"""
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except Exception:
+                pass
+            self._reader = self._writer = None
+
+    def is_connected(self) -> bool:
+        """Check if connected to server"""
+        return self._writer is not None
+
+    async def send_command(self, command: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Send one command and await its newline-terminated JSON reply
+
+        Same wire protocol and response shape as ModelSimClient.send_command.
+        """
+        import asyncio
+
+        if self._writer is None:
+            raise ConnectionError("Not connected to ModelSim server")
+
+        message = {"command": command, "params": params or {}}
+        self._writer.write(_json_dumps(message) + b"\n")
+        await self._writer.drain()
+
+        try:
+            line = await asyncio.wait_for(self._reader.readline(), self.timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Command '{command}' timed out after {self.timeout} seconds")
+        if not line:
+            raise ConnectionError("Server closed connection")
+        return _json_loads(line)
+
+    async def ping(self) -> bool:
+        """Ping server to check if it's alive"""
+        try:
+            response = await self.send_command("ping")
+            return response.get("success", False)
+        except Exception:
+            return False
+
+    async def execute_tcl(self, tcl_code: str) -> Dict[str, Any]:
+        """Execute arbitrary TCL command in ModelSim"""
+        return await self.send_command("exec_tcl", {"tcl_code": tcl_code})
+
+    async def get_wave_geometry(self) -> Dict[str, Any]:
+        """Get wave window geometry from ModelSim"""
+        return await self.send_command("get_wave_geometry")
 
 
 def main():
@@ -10,10 +10,14 @@ Author: Claude Code
 Date: 2026-01-17
 """
 
+import functools
+import mmap
+import os
+import re
 import time
 import sys
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -21,6 +25,158 @@ sys.path.insert(0, str(Path(__file__).parent))
 from modelsim_client import ModelSimClient
 
 
+# ModelSim error patterns, compiled once at import (error analysis can
+# run against multi-KB transcript fragments; the patterns themselves
+# never change). See _parse_modelsim_error for the matching order.
+# Pattern 1: ** Error: (vlog-13069) file.v(15): message
+_ERR_RE_FILELINE = re.compile(r'\*\* Error: \(([^)]+)\) ([^(]+)\((\d+)\): (.+)')
+# Pattern 2: ** Error: (vlog-7) Failed to open ... (errno = ENOENT)
+_ERR_RE_ERRNO = re.compile(r'\*\* Error: \(([^)]+)\) (.+?)\(errno = (\w+)\)', re.DOTALL)
+# Pattern 3: generic ** Error: (code) message
+_ERR_RE_GENERIC = re.compile(r'\*\* Error: \(([^)]+)\) (.+)')
+
+# Suggestion tables for _get_error_suggestions, built once at import.
+# Exact error codes dispatch through a dict; message-substring checks
+# iterate (needles, suggestions) pairs against a single pre-lowered
+# message instead of re-lowering it per comparison.
+_CODE_SUGGESTIONS = {
+    'vlog-7': [
+        "File not found - Check path is relative from sim/ directory",
+        "Use '../hdl/design/file.v' not 'hdl/design/file.v'",
+        "Verify file exists and spelling is correct"
+    ],
+    'vlog-2054': [
+        "File specification is invalid (possibly a directory)",
+        "Check for backslash vs forward slash issues",
+        "Ensure you're specifying a .v file, not a directory"
+    ],
+    'vsim-4005': [
+        "Invalid command argument provided",
+        "Check ModelSim command syntax",
+        "Use --help flag for correct usage"
+    ],
+}
+
+# First matching entry wins (mirrors the original elif chain)
+_VLOG_SUGGESTIONS = [
+    (('syntax error',), [
+        "Check for missing semicolons",
+        "Verify begin/end blocks are properly closed",
+        "Check for mismatched parentheses or brackets"
+    ]),
+    (('not found', 'cannot find', 'failed to open'), [
+        "Verify file path is relative from sim/ directory (use ../hdl/)",
+        "Use forward slashes in paths, not backslashes",
+        "Check that file exists and spelling is correct"
+    ]),
+    (('undeclared',), [
+        "Check signal/variable declarations",
+        "Verify signal is declared before use",
+        "Check spelling of signal name"
+    ]),
+]
+
+_VSIM_SUGGESTIONS = [
+    (('not found', 'unable to find'), [
+        "Check if design was compiled successfully",
+        "Verify module name is correct",
+        "Try running: vlib work && vlog <files>"
+    ]),
+]
+
+# All matching entries apply (waveform checks were independent ifs)
+_WAVEFORM_SUGGESTIONS = [
+    (('not found', 'invalid'), [
+        "Run list_wave_signals.py to get exact signal names",
+        "Do not use leading '/' in signal paths (Git Bash issue)",
+        "Check signal path format: 'module/signal' not '/module/signal'"
+    ]),
+    (('radix', 'property wave'), [
+        "Valid formats: binary, hex, unsigned, signed, octal, ascii",
+        "Use list_wave_signals.py first to confirm signal exists"
+    ]),
+]
+
+_CONTEXT_FALLBACK_SUGGESTIONS = {
+    'compilation': [
+        "For detailed error messages, run: python .claude/skills/modelsim-hdl-dev/scripts/get_transcript.py 50",
+        "Or check sim/transcript file directly"
+    ],
+    'simulation': [
+        "For detailed output, run: python .claude/skills/modelsim-hdl-dev/scripts/get_transcript.py 50",
+        "Or check sim/transcript file directly"
+    ],
+}
+
+_GENERIC_FALLBACK_SUGGESTIONS = [
+    "For more details, run: python .claude/skills/modelsim-hdl-dev/scripts/get_transcript.py 50",
+    "Or check ModelSim transcript window"
+]
+
+
+@functools.lru_cache(maxsize=1)
+def get_project_root() -> Path:
+    """
+    Resolve the project root for CLI scripts
+
+    Honors MODELSIM_PROJECT_ROOT when a parent launcher already knows the
+    directory (skips the getcwd syscall per script), falling back to the
+    current working directory as before. Cached for the process: the
+    scripts never chdir, so long-lived callers (the warm shell, batch
+    loops) pay the getcwd syscall and Path construction once.
+    """
+    return Path(os.environ.get("MODELSIM_PROJECT_ROOT", os.getcwd()))
+
+
+def normalize_signal_path(path: str) -> str:
+    """
+    Normalize a hierarchical signal path to canonical leading-slash form
+
+    CLI scripts accept paths with or without the leading '/' (Git Bash
+    mangles leading slashes), while TCL wave commands want the absolute
+    form. The slice index is the bool from startswith, so there is no
+    branch and at most one new string is allocated.
+
+    Example:
+        >>> normalize_signal_path("counter_tb/count")
+        "/counter_tb/count"
+        >>> normalize_signal_path("/counter_tb/count")
+        "/counter_tb/count"
+    """
+    return "/" + path[path.startswith("/"):]
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_path_cached(path: str) -> str:
+    """
+    Cached body of ModelSimController.normalize_path
+
+    Path normalization is string-pure (no filesystem access), so results
+    are safe to memoize for the process lifetime. Batch flows normalize
+    the same design/testbench paths repeatedly; the cache reduces that to
+    one Path construction per unique path. Module-level so the cache is
+    shared across controller instances and never pins a controller alive.
+    """
+    # Convert backslashes to forward slashes; plain str.replace is all
+    # that's needed for separator translation (no OS resolution), so no
+    # Path object is allocated per call
+    normalized = path.replace("\\", "/")
+
+    # Add ../ prefix if path doesn't already start with it
+    # (ModelSim runs from sim/ directory, so paths need to be relative to sim/)
+    if not normalized.startswith(".."):
+        normalized = f"../{normalized}"
+
+    return normalized
+
+
+# Live clients shared across controller instances in the same process,
+# keyed by (host, port). A second controller (tests, subcommands) reuses
+# the established connection instead of paying a fresh TCP handshake;
+# entries are validated with ping() on acquire and dropped when dead.
+_CLIENT_POOL: Dict[Tuple[str, int], ModelSimClient] = {}
+
+
 class ModelSimController:
     """
     Lean controller for ModelSim automation with socket communication
@@ -45,40 +201,76 @@ class ModelSimController:
         self.project_root = Path(project_root)
         self.server_port = server_port
 
+        # Resolved once to a plain string: transcript polling loops hit
+        # this path per call, and a str skips pathlib's __fspath__
+        # conversion inside every stat/open
+        self._transcript_path = os.fspath(self.project_root / "sim" / "transcript")
+
+        # (mtime_ns, size, lines) -> content cache: pollers calling
+        # read_transcript in a loop pay one stat instead of a full
+        # re-read when nothing was appended
+        self._transcript_cache: Optional[Tuple[Tuple[int, int, Optional[int]], str]] = None
+
         # Initialize client (not connected yet)
         self.client: Optional[ModelSimClient] = None
 
-    def connect(self, max_retries: int = 10, retry_delay: float = 1.0) -> bool:
+    def connect(self, max_retries: int = 10, retry_delay: float = 1.0,
+                max_delay: float = 5.0) -> bool:
         """
         Connect to ModelSim socket server
 
         Args:
             max_retries: Maximum connection attempts
-            retry_delay: Delay between retries (seconds)
+            retry_delay: Initial delay between retries (seconds)
+            max_delay: Cap on the exponential backoff (seconds)
 
         Returns:
             True if connected successfully, False otherwise
         """
+        # Reuse an already-established session: repeated connect() calls
+        # (e.g. from a long-lived process driving several commands) should
+        # not pay a fresh TCP handshake per call
+        if self.client is not None and self.client.is_connected():
+            return True
+
+        # Reuse a live client left by another controller in this process
+        pool_key = ("localhost", self.server_port)
+        pooled = _CLIENT_POOL.get(pool_key)
+        if pooled is not None:
+            if pooled.is_connected() and pooled.ping():
+                self.client = pooled
+                return True
+            _CLIENT_POOL.pop(pool_key, None)
+            pooled.close()  # release the dead client's wakeup FDs
+
+        # Delegate retrying to the client itself: the old outer loop
+        # multiplied the client's internal retries (up to 10x attempts
+        # and sleeps against a down server)
         self.client = ModelSimClient(port=self.server_port)
 
-        for attempt in range(1, max_retries + 1):
-            try:
-                self.client.connect()
+        try:
+            if self.client.connect(max_retries=max_retries, retry_delay=retry_delay,
+                                   max_delay=max_delay):
+                _CLIENT_POOL[pool_key] = self.client
                 return True
-            except Exception as e:
-                if attempt < max_retries:
-                    time.sleep(retry_delay)
-                else:
-                    print(f"Failed to connect after {max_retries} attempts")
-                    self.client = None
-                    return False
+        except Exception:
+            pass
 
+        print(f"Failed to connect after {max_retries} attempts")
+        self.client.close()  # never pooled; free its wakeup FDs
+        self.client = None
         return False
 
     def disconnect(self):
         """Disconnect from ModelSim socket server"""
         if self.client and self.client.is_connected():
             self.client.disconnect()
+        # Drop the now-dead entry so a later connect() doesn't ping it,
+        # and close it so its wakeup socketpair FDs are released
+        for key, pooled in list(_CLIENT_POOL.items()):
+            if pooled is self.client or not pooled.is_connected():
+                _CLIENT_POOL.pop(key, None)
+                pooled.close()
 
     def is_connected(self) -> bool:
         """
@@ -129,32 +321,137 @@ class ModelSimController:
                 'message': f'TCL execution failed: {e}'
             }
 
+    def execute_tcl_batch(self, tcl_commands: List[str]) -> Dict[str, Any]:
+        """
+        Execute several TCL commands in one socket round-trip
+
+        The commands are joined with ';' into a single script, so N
+        commands cost one request/response instead of N. Use for bursts
+        like compile+restart+run where only the combined outcome matters
+        (the result reflects the last command; wrap individual commands
+        in catch server-side if partial failure must not abort).
+
+        Args:
+            tcl_commands: TCL commands in execution order
+
+        Returns:
+            Response dict with 'success' and 'result' keys
+        """
+        return self.execute_tcl("; ".join(tcl_commands))
+
     def read_transcript(self, lines: Optional[int] = None) -> str:
         """
         Read ModelSim transcript file
 
+        Tail reads (lines=N) memory-map the file and scan backward for
+        newlines with mmap.rfind, so only the last page or two are
+        faulted in instead of reading the whole transcript to keep N
+        lines — long simulations leave transcripts of hundreds of MB.
+
+        Repeated calls are gated on (mtime, size): when the transcript
+        has not changed since the last call with the same lines value,
+        the cached string is returned after a single ~1 us stat instead
+        of a multi-ms re-read. ModelSim only ever appends, so an
+        unchanged mtime/size pair means unchanged content.
+
         Args:
             lines: Number of lines to read (None = all)
 
         Returns:
             Transcript content as string
         """
-        transcript_file = self.project_root / "sim" / "transcript"
-
-        if not transcript_file.exists():
+        try:
+            st = os.stat(self._transcript_path)
+        except OSError:
             return ""
 
+        cache_key = (st.st_mtime_ns, st.st_size, lines)
+        if self._transcript_cache is not None and self._transcript_cache[0] == cache_key:
+            return self._transcript_cache[1]
+
         try:
-            with open(transcript_file, 'r', encoding='utf-8', errors='ignore') as f:
-                if lines is None:
-                    return f.read()
-                else:
-                    all_lines = f.readlines()
-                    return ''.join(all_lines[-lines:])
+            if lines is None and st.st_size > (1 << 20):
+                # Large full reads decode straight out of the mapped
+                # page cache (str accepts any buffer), so peak memory is
+                # the decoded string alone — no raw-bytes copy alongside
+                with open(self._transcript_path, 'rb') as f:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        view = memoryview(mm)
+                        try:
+                            content = str(view, 'utf-8', 'ignore')
+                        finally:
+                            view.release()
+                    finally:
+                        mm.close()
+            elif lines is None:
+                # 64 KB buffer instead of the 8 KB default: fewer read
+                # syscalls than the default buffering (the tail path
+                # below does no buffered reads at all — it goes through
+                # mmap)
+                with open(self._transcript_path, 'r', encoding='utf-8',
+                          errors='ignore', buffering=65536) as f:
+                    content = f.read()
+            elif st.st_size == 0:
+                content = ""
+            else:
+                with open(self._transcript_path, 'rb') as f:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        pos = len(mm)
+                        for _ in range(lines + 1):
+                            pos = mm.rfind(b'\n', 0, pos)
+                            if pos < 0:
+                                break
+                        tail = mm[pos + 1:]
+                    finally:
+                        mm.close()
+                content = tail.decode('utf-8', errors='ignore')
+            self._transcript_cache = (cache_key, content)
+            return content
+        except FileNotFoundError:
+            return ""
         except Exception as e:
             print(f"Error reading transcript: {e}")
             return ""
 
+    def read_transcript_tail(self, n_bytes: int = 8192) -> str:
+        """
+        Read the last n_bytes of the transcript via raw file descriptors
+
+        For high-frequency polling (e.g. watching for TEST_RESULT
+        markers) this bypasses the TextIOWrapper/decoder stack and mmap
+        setup entirely: one os.open, one fstat, one positioned read, one
+        close. The decode happens once on the final slice. The slice may
+        start mid-line; callers scanning for markers should ignore the
+        first partial line.
+
+        Args:
+            n_bytes: Number of bytes to read from the end (default: 8 KB)
+
+        Returns:
+            Tail of the transcript as string ("" if file is missing)
+        """
+        try:
+            # O_BINARY keeps Windows from translating line endings
+            fd = os.open(self._transcript_path,
+                         os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        except FileNotFoundError:
+            return ""
+
+        try:
+            size = os.fstat(fd).st_size
+            offset = max(0, size - n_bytes)
+            if hasattr(os, "pread"):
+                data = os.pread(fd, size - offset, offset)
+            else:  # Windows has no pread; seek+read on our private fd
+                os.lseek(fd, offset, os.SEEK_SET)
+                data = os.read(fd, size - offset)
+        finally:
+            os.close(fd)
+
+        return data.decode('utf-8', errors='ignore')
+
     def normalize_path(self, path: str) -> str:
         """
         Normalize path for ModelSim (Windows backslashes → forward slashes, add ../ prefix)
@@ -171,15 +468,7 @@ class ModelSimController:
             >>> controller.normalize_path("../hdl/design/counter.v")
             "../hdl/design/counter.v"
         """
-        # Convert backslashes to forward slashes
-        normalized = str(Path(path)).replace("\\", "/")
-
-        # Add ../ prefix if path doesn't already start with it
-        # (ModelSim runs from sim/ directory, so paths need to be relative to sim/)
-        if not normalized.startswith(".."):
-            normalized = f"../{normalized}"
-
-        return normalized
+        return _normalize_path_cached(path)
 
     def refresh_waveform(self) -> Dict[str, Any]:
         """
@@ -197,14 +486,14 @@ class ModelSimController:
                 "message": "Not connected to ModelSim server"
             }
 
-        # Zoom to full range
-        zoom_result = self.execute_tcl("wave zoom full")
-
-        # Bring wave window to front
-        self.execute_tcl("view wave")
-        self.execute_tcl("raise .main_pane.wave")
-
-        return zoom_result
+        # Zoom to full range, then bring the wave window to front —
+        # fused into one round-trip; the zoom is the part whose failure
+        # matters, so the view/raise are wrapped in catch
+        return self.execute_tcl_batch([
+            "wave zoom full",
+            "catch {view wave}",
+            "catch {raise .main_pane.wave}",
+        ])
 
     def analyze_error(self, result: Dict[str, Any], context: str = "") -> str:
         """
@@ -328,8 +617,6 @@ class ModelSimController:
         Returns:
             Dictionary with keys: file, line, error_code, message, summary, errno
         """
-        import re
-
         result = {
             'file': '',
             'line': '',
@@ -341,8 +628,7 @@ class ModelSimController:
 
         # Pattern 1: ** Error: (vlog-13069) file.v(15): message
         # Example: ** Error: (vlog-13069) counter.v(42): near "endmodule": syntax error
-        pattern1 = r'\*\* Error: \(([^)]+)\) ([^(]+)\((\d+)\): (.+)'
-        match = re.search(pattern1, output)
+        match = _ERR_RE_FILELINE.search(output)
         if match:
             result['error_code'] = match.group(1)
             result['file'] = match.group(2).strip()
@@ -353,8 +639,7 @@ class ModelSimController:
 
         # Pattern 2: ** Error: (vlog-7) Failed to open ... (errno = ENOENT)
         # Example: ** Error: (vlog-7) Failed to open design unit file "file.v" in read mode.\nNo such file or directory. (errno = ENOENT)
-        pattern2 = r'\*\* Error: \(([^)]+)\) (.+?)\(errno = (\w+)\)'
-        match = re.search(pattern2, output, re.DOTALL)
+        match = _ERR_RE_ERRNO.search(output)
         if match:
             result['error_code'] = match.group(1)
             result['message'] = match.group(2).strip()
@@ -364,8 +649,7 @@ class ModelSimController:
 
         # Pattern 3: ** Error: (vlog-2054) File "..." is a directory
         # Generic pattern for other error codes
-        pattern3 = r'\*\* Error: \(([^)]+)\) (.+)'
-        match = re.search(pattern3, output)
+        match = _ERR_RE_GENERIC.search(output)
         if match:
             result['error_code'] = match.group(1)
             result['message'] = match.group(2)
@@ -405,94 +689,38 @@ class ModelSimController:
         Returns:
             List of actionable suggestion strings
         """
+        # Specific error code handling (based on real examples from transcript)
+        code_suggestions = _CODE_SUGGESTIONS.get(error_code)
+        if code_suggestions is not None:
+            return list(code_suggestions)
+
+        # Lower once; every substring check below scans this string
+        ml = message.lower()
         suggestions = []
 
-        # Specific error code handling (based on real examples from transcript)
-        if error_code == 'vlog-7':
-            suggestions.extend([
-                "File not found - Check path is relative from sim/ directory",
-                "Use '../hdl/design/file.v' not 'hdl/design/file.v'",
-                "Verify file exists and spelling is correct"
-            ])
-            return suggestions
-
-        elif error_code == 'vlog-2054':
-            suggestions.extend([
-                "File specification is invalid (possibly a directory)",
-                "Check for backslash vs forward slash issues",
-                "Ensure you're specifying a .v file, not a directory"
-            ])
-            return suggestions
-
-        elif error_code == 'vsim-4005':
-            suggestions.extend([
-                "Invalid command argument provided",
-                "Check ModelSim command syntax",
-                "Use --help flag for correct usage"
-            ])
-            return suggestions
-
-        # Generic compilation errors (vlog-*)
+        # Generic compilation (vlog-*) / simulation (vsim-*) errors:
+        # first matching entry wins
         if error_code.startswith('vlog'):
-            if 'syntax error' in message.lower():
-                suggestions.extend([
-                    "Check for missing semicolons",
-                    "Verify begin/end blocks are properly closed",
-                    "Check for mismatched parentheses or brackets"
-                ])
-            elif 'not found' in message.lower() or 'cannot find' in message.lower() or 'failed to open' in message.lower():
-                suggestions.extend([
-                    "Verify file path is relative from sim/ directory (use ../hdl/)",
-                    "Use forward slashes in paths, not backslashes",
-                    "Check that file exists and spelling is correct"
-                ])
-            elif 'undeclared' in message.lower():
-                suggestions.extend([
-                    "Check signal/variable declarations",
-                    "Verify signal is declared before use",
-                    "Check spelling of signal name"
-                ])
-
-        # Simulation errors (vsim-*)
+            table = _VLOG_SUGGESTIONS
         elif error_code.startswith('vsim'):
-            if 'not found' in message.lower() or 'unable to find' in message.lower():
-                suggestions.extend([
-                    "Check if design was compiled successfully",
-                    "Verify module name is correct",
-                    "Try running: vlib work && vlog <files>"
-                ])
-
-        # Waveform errors (context-based)
+            table = _VSIM_SUGGESTIONS
+        else:
+            table = ()
+        for needles, tips in table:
+            if any(needle in ml for needle in needles):
+                suggestions.extend(tips)
+                break
+
+        # Waveform errors (context-based): all matching entries apply
         if context == "waveform":
-            if 'not found' in message.lower() or 'invalid' in message.lower():
-                suggestions.extend([
-                    "Run list_wave_signals.py to get exact signal names",
-                    "Do not use leading '/' in signal paths (Git Bash issue)",
-                    "Check signal path format: 'module/signal' not '/module/signal'"
-                ])
-            if 'radix' in message.lower() or 'property wave' in message.lower():
-                suggestions.extend([
-                    "Valid formats: binary, hex, unsigned, signed, octal, ascii",
-                    "Use list_wave_signals.py first to confirm signal exists"
-                ])
+            for needles, tips in _WAVEFORM_SUGGESTIONS:
+                if any(needle in ml for needle in needles):
+                    suggestions.extend(tips)
 
         # Generic suggestions based on context (fallback)
         if not suggestions:
-            if context == "compilation":
-                suggestions.extend([
-                    "For detailed error messages, run: python .claude/skills/modelsim-hdl-dev/scripts/get_transcript.py 50",
-                    "Or check sim/transcript file directly"
-                ])
-            elif context == "simulation":
-                suggestions.extend([
-                    "For detailed output, run: python .claude/skills/modelsim-hdl-dev/scripts/get_transcript.py 50",
-                    "Or check sim/transcript file directly"
-                ])
-            else:
-                suggestions.extend([
-                    "For more details, run: python .claude/skills/modelsim-hdl-dev/scripts/get_transcript.py 50",
-                    "Or check ModelSim transcript window"
-                ])
+            suggestions = list(_CONTEXT_FALLBACK_SUGGESTIONS.get(
+                context, _GENERIC_FALLBACK_SUGGESTIONS))
 
         return suggestions
 
@@ -0,0 +1,33 @@
+"""
+ModelSim installation path discovery.
+
+Shared by the launcher scripts (start_modelsim_server.py,
+view_waveform.py) so the executable lookup and its filesystem stat
+happen once per process, not once per call.
+"""
+
+import functools
+from pathlib import Path
+from typing import Optional
+
+# Default install location (Intel FPGA Starter Edition 20.1)
+MODELSIM_DEFAULT_PATH = "C:/intelFPGA/20.1/modelsim_ase/win32aloem"
+
+
+@functools.lru_cache(maxsize=4)
+def find_modelsim_exe(exe_name: str, hint: str = MODELSIM_DEFAULT_PATH) -> Optional[Path]:
+    """
+    Locate a ModelSim executable under the install directory.
+
+    The result (including a miss) is cached per (exe_name, hint), so
+    repeated launches in one session pay the .exists() stat only once.
+
+    Args:
+        exe_name: Executable file name (e.g. "vsim.exe", "modelsim.exe")
+        hint: ModelSim installation directory
+
+    Returns:
+        Path to the executable, or None if it does not exist
+    """
+    exe = Path(hint) / exe_name
+    return exe if exe.exists() else None
@@ -119,61 +119,73 @@ proc handle_command {sock} {
     send_response $sock $response
 }
 
+# Undo JSON string escaping (inverse of what the Python client's
+# json.dumps applies). string map scans left to right in one pass, so
+# "\\n" correctly becomes a backslash followed by n, not a newline.
+# \uXXXX escapes are not handled: all payloads the client sends are
+# ASCII TCL code and file paths.
+proc json_unescape_string {str} {
+    return [string map [list \
+        "\\\\" "\\" \
+        "\\\"" "\"" \
+        "\\/"  "/" \
+        "\\n"  "\n" \
+        "\\r"  "\r" \
+        "\\t"  "\t" \
+        "\\b"  "\b" \
+        "\\f"  "\f"] $str]
+}
+
 # Parse JSON-like command (simplified parser)
+#
+# String values are matched escape-aware — ((?:[^"\\]|\\.)*) consumes
+# escaped characters as pairs — so quotes, braces and backslashes
+# inside a value (batched TCL code is full of them) no longer truncate
+# the match. Keys are searched over the whole line rather than inside
+# a brace-delimited params substring, because a "}" inside tcl_code
+# would end that substring early; the client never repeats a key name
+# as text inside another value, so this is unambiguous for the
+# messages it sends.
 proc parse_json_command {json_str} {
-    # Remove outer braces and whitespace
     set json_str [string trim $json_str]
-    set json_str [string range $json_str 1 end-1]
 
     # Initialize result dict
     set result [dict create command "" params [dict create]]
 
-    # Simple state machine to parse JSON
-    set in_string 0
-    set current_key ""
-    set current_value ""
-    set depth 0
-    set i 0
-
     # Look for "command" field
-    if {[regexp {"command"\s*:\s*"([^"]+)"} $json_str -> cmd_value]} {
-        dict set result command $cmd_value
-    }
-
-    # Look for "params" object
-    if {[regexp {"params"\s*:\s*\{([^\}]*)\}} $json_str -> params_str]} {
-        # Parse params as key-value pairs
-        set params_dict [dict create]
-
-        # Extract design_files array
-        if {[regexp {"design_files"\s*:\s*\[([^\]]*)\]} $params_str -> files_str]} {
-            set files_list {}
-            foreach file_match [regexp -all -inline {"([^"]+)"} $files_str] {
-                if {[string index $file_match 0] == "\""} {
-                    lappend files_list [string range $file_match 1 end-1]
-                }
-            }
-            dict set params_dict design_files $files_list
-        }
+    if {[regexp {"command"\s*:\s*"((?:[^"\\]|\\.)*)"} $json_str -> cmd_value]} {
+        dict set result command [json_unescape_string $cmd_value]
+    }
 
-        # Extract testbench_file
-        if {[regexp {"testbench_file"\s*:\s*"([^"]+)"} $params_str -> tb_file]} {
-            dict set params_dict testbench_file $tb_file
-        }
+    set params_dict [dict create]
 
-        # Extract time
-        if {[regexp {"time"\s*:\s*"([^"]+)"} $params_str -> time_val]} {
-            dict set params_dict time $time_val
+    # Extract design_files array (elements are JSON strings; the array
+    # body match steps over them so a "]" inside a path can't end it)
+    if {[regexp {"design_files"\s*:\s*\[((?:[^\]"]|"(?:[^"\\]|\\.)*")*)\]} $json_str -> files_str]} {
+        set files_list {}
+        foreach {file_match file_val} [regexp -all -inline {"((?:[^"\\]|\\.)*)"} $files_str] {
+            lappend files_list [json_unescape_string $file_val]
         }
+        dict set params_dict design_files $files_list
+    }
 
-        # Extract tcl_code
-        if {[regexp {"tcl_code"\s*:\s*"([^"]+)"} $params_str -> tcl_val]} {
-            dict set params_dict tcl_code $tcl_val
-        }
+    # Extract testbench_file
+    if {[regexp {"testbench_file"\s*:\s*"((?:[^"\\]|\\.)*)"} $json_str -> tb_file]} {
+        dict set params_dict testbench_file [json_unescape_string $tb_file]
+    }
 
-        dict set result params $params_dict
+    # Extract time
+    if {[regexp {"time"\s*:\s*"((?:[^"\\]|\\.)*)"} $json_str -> time_val]} {
+        dict set params_dict time [json_unescape_string $time_val]
     }
 
+    # Extract tcl_code
+    if {[regexp {"tcl_code"\s*:\s*"((?:[^"\\]|\\.)*)"} $json_str -> tcl_val]} {
+        dict set params_dict tcl_code [json_unescape_string $tcl_val]
+    }
+
+    dict set result params $params_dict
+
     return $result
 }
 
@@ -5,43 +5,79 @@ List signals currently displayed in wave window.
 This script exports wave configuration and parses it to show signal names and formats.
 """
 
+import json
 import sys
 import re
-import tempfile
 from pathlib import Path
 
 # Import from same directory
 sys.path.insert(0, str(Path(__file__).parent / "internal"))
-from modelsim_controller import ModelSimController
-
-
-def parse_wave_format_file(file_path):
+from modelsim_controller import ModelSimController, get_project_root
+
+# Export the wave config and return its text in the same round-trip:
+# write format wave only writes to a file, so the script writes to a
+# scratch file in ModelSim's working directory (sim/), reads it back
+# and deletes it — the temp file never crosses to the Python side
+_WAVE_EXPORT_TCL = (
+    'set __wf ".wave_export_[pid].do"; '
+    'write format wave $__wf; '
+    'set __fh [open $__wf r]; '
+    'set __data [read $__fh]; '
+    'close $__fh; '
+    'file delete $__wf; '
+    'set __data'
+)
+
+# Signal lines in a wave format file:
+#   add wave -noupdate -radix <format> /path/to/signal
+#   add wave -noupdate {/path/to/signal}
+#   add wave -noupdate -radix <format> {/path/to/signal[7:0]}
+# A trailing bit subscript is matched but not captured: the signal
+# name keeps its unsubscripted path. Compiled once, anchored per line
+# (re.MULTILINE) so the whole config is scanned in a single pass with
+# no lazy-quantifier backtracking across line boundaries
+_WAVE_RE = re.compile(
+    r'^\s*add wave\b(?:[^\n]*?-radix\s+(\w+))?[^\n]*?(/[\w/]+)(?:\[[^\]]*\])?\}?\s*$',
+    re.MULTILINE
+)
+
+
+def parse_wave_format_text(content):
     """
-    Parse ModelSim wave format file to extract signal names and formats.
+    Parse ModelSim wave format text to extract signal names and formats.
+
+    Args:
+        content: Wave format file contents (output of 'write format wave')
 
     Returns:
         list: List of (signal_name, format) tuples
     """
-    signals = []
-
     try:
-        with open(file_path, 'r') as f:
-            content = f.read()
-
-        # Pattern for signal lines: add wave -noupdate -radix <format> <signal_path>
-        # or: add wave -noupdate <signal_path>
-        pattern = r'add wave.*?(?:-radix (\w+)\s+)?(/[\w/]+)'
-
-        matches = re.findall(pattern, content)
+        return [
+            (m.group(2), m.group(1) or 'default')
+            for m in _WAVE_RE.finditer(content)
+        ]
+    except Exception as e:
+        print(f"Warning: Could not parse wave format text: {e}")
+        return []
 
-        for radix, signal_path in matches:
-            format_str = radix if radix else 'default'
-            signals.append((signal_path, format_str))
 
-    except Exception as e:
-        print(f"Warning: Could not parse wave format file: {e}")
+def write_signal_cache(project_root, signals):
+    """
+    Write signal names to sim/.wave_signals.json for other scripts.
 
-    return signals
+    change_wave_format.py resolves partial signal names against this
+    cache, so the common list-then-format workflow only connects to
+    ModelSim once. Best-effort: a cache write failure never fails the
+    listing itself.
+    """
+    cache_file = Path(project_root) / "sim" / ".wave_signals.json"
+    try:
+        cache_file.parent.mkdir(exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump({"signals": [path for path, _ in signals]}, f)
+    except OSError as e:
+        print(f"Warning: Could not write signal cache: {e}")
 
 
 def main():
@@ -68,8 +104,8 @@ def main():
             print('Use --help for usage information')
             sys.exit(1)
 
-    # Get project root from current working directory
-    project_root = Path.cwd()
+    # Project root honors MODELSIM_PROJECT_ROOT (defaults to the CWD)
+    project_root = get_project_root()
 
     print("⏳ Listing signals in wave window...")
     print()
@@ -83,17 +119,9 @@ def main():
             print("✗ ERROR: Cannot connect to ModelSim socket server")
             sys.exit(1)
 
-        # Create temporary file for wave export
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.do', delete=False) as tmp:
-            temp_file = Path(tmp.name)
-
-        # Export wave configuration
-        # Convert Windows path to forward slashes for TCL
-        temp_file_tcl = str(temp_file).replace('\\', '/')
-
-        # Use the correct command as suggested by user
-        tcl_cmd = f'write format wave {temp_file_tcl}'
-        result = controller.execute_tcl(tcl_cmd)
+        # Export wave configuration and read it back in one round-trip;
+        # the scratch file lives (briefly) in sim/ on the ModelSim side
+        result = controller.execute_tcl(_WAVE_EXPORT_TCL)
 
         # Disconnect
         controller.disconnect()
@@ -101,14 +129,14 @@ def main():
         if not result['success']:
             error_msg = controller.analyze_error(result, context="waveform")
             print(error_msg)
-            temp_file.unlink(missing_ok=True)
             sys.exit(1)
 
-        # Parse the exported file
-        signals = parse_wave_format_file(temp_file)
+        # Parse the exported wave config text
+        signals = parse_wave_format_text(str(result.get('output', '')))
 
-        # Clean up temp file
-        temp_file.unlink(missing_ok=True)
+        # Refresh the shared signal-name cache
+        if signals:
+            write_signal_cache(project_root, signals)
 
         # Display results
         if not signals:
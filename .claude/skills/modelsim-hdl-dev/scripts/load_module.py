@@ -27,13 +27,22 @@ Benefits:
 - Clear workflow: start server once, then load/switch designs as needed
 """
 
+import re
 import sys
 from pathlib import Path
 
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent / "internal"))
 
-from modelsim_controller import ModelSimController
+from modelsim_controller import ModelSimController, get_project_root
+
+# Result lines worth surfacing after a run; one MULTILINE alternation
+# scans the whole transcript slice in a single pass instead of a
+# per-line strip + keyword loop
+_RESULT_RE = re.compile(
+    r'^[ \t]*(.*?(?:TEST_RESULT:|Error:|Warning:).*?)[ \t\r]*$',
+    re.MULTILINE
+)
 
 
 def load_module(design_files, testbench_file, top_module, sim_time="1us"):
@@ -54,8 +63,8 @@ def load_module(design_files, testbench_file, top_module, sim_time="1us"):
     design_files = [Path(f) for f in design_files]
     testbench_file = Path(testbench_file)
 
-    # Get project root (current working directory)
-    project_root = Path.cwd()
+    # Project root honors MODELSIM_PROJECT_ROOT (defaults to the CWD)
+    project_root = get_project_root()
 
     print("="*60)
     print("ModelSim Module Loader")
@@ -84,31 +93,19 @@ def load_module(design_files, testbench_file, top_module, sim_time="1us"):
 
     print("✓ Connected to ModelSim")
 
-    # Step 1: Exit current simulation (if any)
+    # Steps 1+2: clear any previous simulation and compile all files in
+    # a single round-trip — quit -sim only runs when a design is loaded,
+    # and one vlog invocation shares its parser setup across every file
     print("\n[2/7] Preparing ModelSim...")
-    try:
-        controller.execute_tcl('quit -sim')
-        print("✓ Previous simulation cleared")
-    except:
-        print("✓ No previous simulation (this is OK)")
-
-    # Step 2: Compile design
     print("\n[3/7] Compiling design files...")
 
-    # Compile each design file
-    for design_file in design_files:
-        design_path = controller.normalize_path(str(design_file))
-        result = controller.execute_tcl(f'vlog -work work {design_path}')
-        if not result['success']:
-            print()
-            error_msg = controller.analyze_error(result, context="compilation")
-            print(error_msg)
-            print()
-            return False
-
-    # Compile testbench
+    design_paths = [controller.normalize_path(str(f)) for f in design_files]
     tb_path = controller.normalize_path(str(testbench_file))
-    result = controller.execute_tcl(f'vlog -work work {tb_path}')
+    result = controller.execute_tcl(
+        'if {[catch {runStatus} __s] == 0 && $__s ne "nodesign"} '
+        '{catch {quit -sim}}; '
+        f'vlog -work work {" ".join(design_paths)} {tb_path}'
+    )
     if not result['success']:
         print()
         error_msg = controller.analyze_error(result, context="compilation")
@@ -118,9 +115,16 @@ def load_module(design_files, testbench_file, top_module, sim_time="1us"):
 
     print("✓ Compilation successful")
 
-    # Step 3: Load testbench
+    # Steps 3+4: load testbench, disable the $finish dialog and add
+    # waveforms as one batched script (one round-trip instead of four)
     print(f"\n[4/7] Loading testbench: {top_module}...")
-    vsim_result = controller.execute_tcl(f'vsim work.{top_module}')
+    print("\n[5/7] Adding waveforms...")
+    vsim_result = controller.execute_tcl_batch([
+        f'vsim work.{top_module}',
+        'onfinish stop',
+        'add wave -r /*',
+        'wave zoom full',
+    ])
     if not vsim_result.get('success'):
         print()
         error_msg = controller.analyze_error(vsim_result, context="simulation")
@@ -128,16 +132,7 @@ def load_module(design_files, testbench_file, top_module, sim_time="1us"):
         print()
         return False
 
-    # Set onfinish to stop (prevent $finish dialog)
-    controller.execute_tcl('onfinish stop')
-
-    print("✓ Testbench loaded")
-
-    # Step 4: Add waveforms
-    print("\n[5/7] Adding waveforms...")
-    controller.execute_tcl('add wave -r /*')
-    controller.execute_tcl('wave zoom full')
-    print("✓ Waveforms added")
+    print("✓ Testbench loaded, waveforms added")
 
     # Step 5: Run simulation
     print(f"\n[6/7] Running simulation for {sim_time}...")
@@ -169,13 +164,11 @@ def load_module(design_files, testbench_file, top_module, sim_time="1us"):
 
     transcript = controller.read_transcript(lines=100)
 
-    # Extract important lines
+    # Extract important lines in one C-level scan
     found_results = False
-    for line in transcript.split('\n'):
-        line = line.strip()
-        if any(keyword in line for keyword in ['TEST_RESULT:', 'Error:', 'Warning:']):
-            print(line)
-            found_results = True
+    for match in _RESULT_RE.finditer(transcript):
+        print(match.group(1))
+        found_results = True
 
     if not found_results:
         print("(No TEST_RESULT markers or errors found)")
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Interactive ModelSim shell - warm in-process REPL for fast iteration.
+
+Each CLI script in this directory pays Python interpreter startup,
+module import and a fresh TCP connect on every invocation (~100-300 ms
+before any work happens). For interactive debug loops this is the
+dominant latency. This shell imports the controller once, connects
+once, and dispatches commands inside one resident process, so each
+operation costs only its single socket round-trip.
+
+Commands:
+    tcl <command...>                 - Execute raw TCL command
+    format <signal> <radix>          - Change signal display format
+    compile <design> <tb>            - Recompile design + testbench
+    run <duration>                   - Run simulation (e.g. run 1us)
+    restart                          - Restart simulation from time 0
+    quitsim                          - Quit current simulation (GUI stays open)
+    zoom full | <start> <end>        - Adjust waveform zoom
+    transcript [lines]               - Show transcript tail (default 20)
+    refresh                          - Refresh waveform display
+    help                             - Show command list
+    quit / exit                      - Leave the shell
+
+Usage:
+    python .claude/skills/modelsim-hdl-dev/scripts/modelsim_shell.py
+"""
+
+import sys
+from pathlib import Path
+
+# readline is optional (not available on stock Windows Python); importing
+# it is enough to get history and line editing in input()
+try:
+    import readline  # noqa: F401
+except ImportError:
+    pass
+
+# Import from same directory
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+_INTERNAL_DIR = str(Path(__file__).resolve().parent / "internal")
+for _d in (_SCRIPTS_DIR, _INTERNAL_DIR):
+    if _d not in sys.path:
+        sys.path.insert(0, _d)
+from modelsim_controller import ModelSimController, get_project_root, normalize_signal_path
+from change_wave_format import apply_digital_format, VALID_FORMATS, DIGITAL_FORMATS
+
+
+HELP_TEXT = """Commands:
+  tcl <command...>         Execute raw TCL command
+  format <signal> <radix>  Change signal format ({formats})
+  compile <design> <tb>    Recompile design + testbench (single vlog)
+  run <duration>           Run simulation (e.g. run 1us)
+  restart                  Restart simulation from time 0
+  quitsim                  Quit current simulation (GUI stays open)
+  zoom full | <start> <end>  Adjust waveform zoom
+  transcript [lines]       Show transcript tail (default 20)
+  refresh                  Refresh waveform display
+  help                     Show this help
+  quit / exit              Leave the shell""".format(formats=', '.join(DIGITAL_FORMATS))
+
+
+def show_result(result):
+    """Print an execute_tcl result dict in shell style."""
+    output = str(result.get('output', '')).strip()
+    if result.get('success'):
+        if output:
+            print(output)
+        print("✓ OK")
+    else:
+        print(f"✗ ERROR: {result.get('error', output or 'command failed')}")
+
+
+def dispatch(controller, command, args):
+    """
+    Execute one shell command against the shared controller.
+
+    Returns:
+        bool: False when the shell should exit, True otherwise
+    """
+    if command in ('quit', 'exit'):
+        return False
+
+    if command == 'help':
+        print(HELP_TEXT)
+
+    elif command == 'tcl':
+        if not args:
+            print("Usage: tcl <command...>")
+        else:
+            show_result(controller.execute_tcl(' '.join(args)))
+
+    elif command == 'format':
+        if len(args) != 2:
+            print("Usage: format <signal> <radix>")
+        elif args[1].lower() not in VALID_FORMATS:
+            print(f"✗ ERROR: Invalid format '{args[1]}'")
+            print(f"  Valid formats: {', '.join(DIGITAL_FORMATS)}")
+        else:
+            signal_path = normalize_signal_path(args[0])
+            show_result(apply_digital_format(controller, signal_path, args[1].lower()))
+
+    elif command == 'compile':
+        if len(args) != 2:
+            print("Usage: compile <design_file> <testbench_file>")
+        else:
+            design_path = controller.normalize_path(args[0])
+            tb_path = controller.normalize_path(args[1])
+            show_result(controller.execute_tcl(
+                f'if {{[catch {{runStatus}} __s] == 0 && $__s ne "nodesign"}} '
+                f'{{catch {{quit -sim}}}}; '
+                f'vlog -work work {design_path} {tb_path}'
+            ))
+
+    elif command == 'run':
+        if len(args) != 1:
+            print("Usage: run <duration>  (e.g. run 1us)")
+        else:
+            show_result(controller.execute_tcl(f"run {args[0]}"))
+
+    elif command == 'restart':
+        show_result(controller.execute_tcl("restart -f"))
+
+    elif command == 'quitsim':
+        show_result(controller.execute_tcl("quit -sim"))
+
+    elif command == 'zoom':
+        if len(args) == 1 and args[0].lower() == 'full':
+            show_result(controller.execute_tcl("wave zoom full"))
+        elif len(args) == 2:
+            show_result(controller.execute_tcl(f"wave zoom range {args[0]} {args[1]}"))
+        else:
+            print("Usage: zoom full  |  zoom <start> <end>")
+
+    elif command == 'transcript':
+        lines = 20
+        if args:
+            try:
+                lines = int(args[0])
+            except ValueError:
+                print(f"✗ ERROR: Invalid line count '{args[0]}'")
+                return True
+        print(controller.read_transcript(lines=lines))
+
+    elif command == 'refresh':
+        controller.refresh_waveform()
+        print("✓ OK")
+
+    else:
+        print(f"✗ Unknown command '{command}' (try 'help')")
+
+    return True
+
+
+def main():
+    """Main entry point for the interactive shell."""
+    project_root = get_project_root()
+
+    print("ModelSim interactive shell")
+    print("⏳ Connecting to ModelSim socket server...")
+
+    controller = ModelSimController(project_root)
+    if not controller.connect(max_retries=3, retry_delay=0.5):
+        print("✗ ERROR: Cannot connect to ModelSim socket server")
+        print("  Make sure ModelSim is running with socket server enabled.")
+        print('  Run: python .claude/skills/modelsim-hdl-dev/scripts/start_modelsim_server.py')
+        sys.exit(1)
+
+    print("✓ Connected to ModelSim at localhost:12345 (type 'help' for commands)")
+
+    try:
+        while True:
+            try:
+                line = input("modelsim> ").strip()
+            except EOFError:
+                break
+            if not line:
+                continue
+
+            parts = line.split()
+            try:
+                if not dispatch(controller, parts[0].lower(), parts[1:]):
+                    break
+            except Exception as e:
+                print(f"✗ ERROR: {e}")
+
+    except KeyboardInterrupt:
+        print()
+
+    controller.disconnect()
+    print("Disconnected from ModelSim")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
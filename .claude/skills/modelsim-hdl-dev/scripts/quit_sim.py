@@ -5,12 +5,12 @@ Quit current simulation.
 This script wraps modelsim_controller.py's execute_tcl() method for quitting simulation.
 """
 
+import os
 import sys
-from pathlib import Path
 
-# Import from same directory
-sys.path.insert(0, str(Path(__file__).parent / "internal"))
-from modelsim_controller import ModelSimController
+# Import from same directory (controller import itself is deferred to
+# main() so --help never pays for it)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "internal"))
 
 
 def main():
@@ -23,8 +23,10 @@ def main():
         print("No arguments required.")
         sys.exit(0)
 
-    # Get project root from current working directory
-    project_root = Path.cwd()
+    from modelsim_controller import ModelSimController, get_project_root
+
+    # Project root honors MODELSIM_PROJECT_ROOT (defaults to the CWD)
+    project_root = get_project_root()
 
     print("⏳ Quitting simulation...")
 
@@ -44,15 +46,16 @@ def main():
         controller.disconnect()
 
         # Check result
+        # One write per banner instead of one flush per line
         if result['success']:
-            print()
-            print("✓ SUCCESS: Simulation quit")
-            print("  ModelSim GUI is still running")
+            sys.stdout.write(
+                "\n✓ SUCCESS: Simulation quit\n"
+                "  ModelSim GUI is still running\n")
             sys.exit(0)
         else:
-            print()
-            print("✗ FAILED: Could not quit simulation")
-            print(f"  {result.get('message', 'Unknown error')}")
+            sys.stdout.write(
+                "\n✗ FAILED: Could not quit simulation\n"
+                f"  {result.get('message', 'Unknown error')}\n")
             sys.exit(1)
 
     except KeyboardInterrupt:
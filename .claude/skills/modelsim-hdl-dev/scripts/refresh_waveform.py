@@ -10,7 +10,7 @@ from pathlib import Path
 
 # Import from same directory
 sys.path.insert(0, str(Path(__file__).parent / "internal"))
-from modelsim_controller import ModelSimController
+from modelsim_controller import ModelSimController, get_project_root
 
 
 def main():
@@ -22,8 +22,8 @@ def main():
         print("No arguments required.")
         sys.exit(0)
 
-    # Get project root from current working directory
-    project_root = Path.cwd()
+    # Project root honors MODELSIM_PROJECT_ROOT (defaults to the CWD)
+    project_root = get_project_root()
 
     print("⏳ Refreshing waveform...")
 
@@ -5,12 +5,12 @@ Restart simulation from time 0.
 Self-contained restart logic using controller infrastructure only.
 """
 
+import os
 import sys
-from pathlib import Path
 
-# Import from same directory
-sys.path.insert(0, str(Path(__file__).parent / "internal"))
-from modelsim_controller import ModelSimController
+# Import from same directory (controller import itself is deferred to
+# main() so --help never pays for it)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "internal"))
 
 
 def main():
@@ -23,8 +23,10 @@ def main():
         print("No arguments required.")
         sys.exit(0)
 
-    # Get project root from current working directory
-    project_root = Path.cwd()
+    from modelsim_controller import ModelSimController, get_project_root
+
+    # Project root honors MODELSIM_PROJECT_ROOT (defaults to the CWD)
+    project_root = get_project_root()
 
     print("⏳ Restarting simulation...")
 
@@ -45,9 +47,10 @@ def main():
 
         # Check result
         if result['success']:
-            print()
-            print("✓ SUCCESS: Simulation restarted from time 0")
-            print("  Waveforms are intact")
+            # One write per banner instead of one flush per line
+            sys.stdout.write(
+                "\n✓ SUCCESS: Simulation restarted from time 0\n"
+                "  Waveforms are intact\n")
             sys.exit(0)
         else:
             print()
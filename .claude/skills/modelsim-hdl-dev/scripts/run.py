@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+One-hop launcher for the CLI scripts in this directory.
+
+Wrappers (shells, skill runners) that spawn 'python <script>.py ...'
+through this launcher avoid a second interpreter startup: on POSIX the
+launcher process is replaced in place with os.execv (no intermediate
+fork/wait). A small whitelist of stdlib-only one-shot scripts
+(quit_sim, restart_sim, zoom_waveform — total work is one socket
+round-trip) additionally runs under -S so site.py and site-packages
+scanning are skipped; for them -S only hides the optional orjson
+accelerator, and the client's stdlib json fallback is fine for such
+tiny payloads. Every other target launches without -S, because scripts
+like capture_screenshot genuinely import from site-packages (pywin32,
+Pillow) and would fail under it.
+
+Usage:
+    python run.py <script> [args...]
+
+Examples:
+    python run.py quit_sim
+    python run.py zoom_waveform full
+    python run.py run_sim 1us
+"""
+
+import os
+import sys
+
+# Scripts known to import nothing from site-packages; only these are
+# launched with -S (skipping site.py). Anything else gets a normal
+# interpreter so site-packages imports (pywin32, Pillow, orjson) work.
+_STDLIB_ONLY = frozenset(('quit_sim', 'restart_sim', 'zoom_waveform'))
+
+
+def main():
+    """Resolve the target script and exec into it."""
+    if len(sys.argv) < 2 or sys.argv[1] in ('--help', '-h'):
+        print("Usage: run.py <script> [args...]")
+        print()
+        print("Launches a CLI script from this directory in one process hop.")
+        print()
+        print("Examples:")
+        print('  python run.py quit_sim')
+        print('  python run.py zoom_waveform full')
+        print('  python run.py run_sim 1us')
+        sys.exit(0 if len(sys.argv) >= 2 else 1)
+
+    name = sys.argv[1]
+    if not name.endswith('.py'):
+        name += '.py'
+    target = os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+    if not os.path.isfile(target):
+        print(f"✗ ERROR: No such script: {name}")
+        sys.exit(1)
+
+    argv = [sys.executable]
+    if name[:-3] in _STDLIB_ONLY:
+        argv.append('-S')
+    argv += [target] + sys.argv[2:]
+    if os.name == 'posix':
+        # Replace this process outright — zero extra processes
+        os.execv(sys.executable, argv)
+    else:
+        # Windows exec* spawns-and-exits, which returns control to the
+        # shell before the child finishes; run the child and mirror its
+        # exit code instead
+        import subprocess
+        sys.exit(subprocess.call(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,109 @@ Run simulation for specified time.
 Self-contained simulation execution using controller infrastructure only.
 """
 
+import os
 import sys
+import threading
 from pathlib import Path
 
-# Import from same directory
-sys.path.insert(0, str(Path(__file__).parent / "internal"))
-from modelsim_controller import ModelSimController
+# Import from same directory (controller import itself is deferred to
+# main() so usage errors never pay for it)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "internal"))
+
+
+def _read_delta(path, offset):
+    """
+    Read transcript bytes appended since offset.
+
+    Opens per poll (Windows file-sharing with ModelSim is friendlier to
+    short-lived handles) and reads only the new region, so each poll
+    costs the delta, not the file size.
+
+    Returns:
+        (bytes, int): New data and the updated offset
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except OSError:
+        return b"", offset
+    try:
+        size = os.fstat(fd).st_size
+        if size <= offset:
+            # Transcript may have been truncated/rotated; restart at 0
+            return b"", (offset if size == offset else 0)
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.read(fd, size - offset), size
+    finally:
+        os.close(fd)
+
+
+def run_with_live_tail(controller, sim_time, poll_interval=0.2, refresh=False):
+    """
+    Run the simulation while tailing the transcript to the console.
+
+    The socket request for 'run' blocks until the simulator finishes,
+    so it is issued from a worker thread while the main thread polls the
+    transcript for appended lines and echoes them live — TEST_RESULT
+    markers and errors show up as they happen instead of after the run.
+    Only the worker touches the socket; the main thread only reads the
+    transcript file.
+
+    With refresh=True the waveform refresh commands ride in the same
+    batched script as the run, so run + refresh costs one round-trip
+    instead of two (a failed run short-circuits the refresh).
+
+    Args:
+        controller: Connected ModelSimController instance
+        sim_time: Simulation time string (e.g. "1us")
+        poll_interval: Seconds between transcript polls
+        refresh: Also refresh the waveform in the same round-trip
+
+    Returns:
+        Result dict from execute_tcl("run ...")
+    """
+    transcript = str(Path(controller.project_root) / "sim" / "transcript")
+    try:
+        offset = os.stat(transcript).st_size
+    except OSError:
+        offset = 0
+
+    commands = [f"run {sim_time}"]
+    if refresh:
+        # Same script refresh_waveform() sends, spliced onto the run
+        commands += ["wave zoom full", "catch {view wave}",
+                     "catch {raise .main_pane.wave}"]
+
+    box = {}
+
+    def worker():
+        box['result'] = controller.execute_tcl_batch(commands)
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+
+    partial = b""
+    while True:
+        thread.join(poll_interval)
+        data, offset = _read_delta(transcript, offset)
+        if data:
+            lines = (partial + data).split(b"\n")
+            partial = lines.pop()
+            for line in lines:
+                print(f"  | {line.decode('utf-8', errors='ignore').rstrip()}")
+        if not thread.is_alive():
+            break
+    # One last poll catches lines flushed between the final read and the
+    # socket reply
+    data, offset = _read_delta(transcript, offset)
+    if data:
+        lines = (partial + data).split(b"\n")
+        partial = lines.pop()
+        for line in lines:
+            print(f"  | {line.decode('utf-8', errors='ignore').rstrip()}")
+    if partial:
+        print(f"  | {partial.decode('utf-8', errors='ignore').rstrip()}")
+
+    return box.get('result', {'success': False, 'errors': ['run thread died']})
 
 
 def main():
@@ -27,10 +124,12 @@ def main():
         print('  python run_sim.py "10ms"')
         sys.exit(1)
 
+    from modelsim_controller import ModelSimController, get_project_root
+
     sim_time = sys.argv[1]
 
-    # Get project root from current working directory
-    project_root = Path.cwd()
+    # Project root honors MODELSIM_PROJECT_ROOT (defaults to the CWD)
+    project_root = get_project_root()
 
     print(f"⏳ Running simulation for {sim_time}...")
 
@@ -44,28 +143,28 @@ def main():
             print("  Make sure ModelSim is running with socket server enabled.")
             sys.exit(1)
 
-        # Run simulation
-        run_result = controller.execute_tcl(f"run {sim_time}")
+        # Run simulation, echoing transcript output live; the waveform
+        # refresh rides in the same round-trip as the run
+        run_result = run_with_live_tail(controller, sim_time, refresh=True)
 
         if not run_result['success']:
             print()
             error_msg = controller.analyze_error(run_result, context="simulation")
             print(error_msg)
-            controller.disconnect()
+            # No explicit disconnect on the error exit: process teardown
+            # closes the socket, and skipping the shutdown round-trip
+            # gets the error in front of the user faster
             sys.exit(1)
 
         print(f"✓ Simulation ran for {sim_time}")
 
-        # Refresh waveform and bring to front
-        print("⏳ Refreshing waveform...")
-        controller.refresh_waveform()
-
         # Disconnect
         controller.disconnect()
 
-        print()
-        print(f"✓ SUCCESS: Simulation completed for {sim_time}")
-        print("  Waveform refreshed and brought to front")
+        # One write per banner instead of one flush per line
+        sys.stdout.write(
+            f"\n✓ SUCCESS: Simulation completed for {sim_time}\n"
+            "  Waveform refreshed and brought to front\n")
         sys.exit(0)
 
     except KeyboardInterrupt:
@@ -14,118 +14,144 @@ Benefits of this approach:
 - More flexible workflow
 """
 
+import os
 import sys
 import subprocess
-import time
 from pathlib import Path
 
-# Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent))
-sys.path.insert(0, str(Path(__file__).parent / "internal"))
-
-from modelsim_controller import ModelSimController
+# Add scripts directory to path (heavier imports are deferred into
+# start_modelsim_server so import errors surface next to their use)
+_SCRIPTS_DIR = os.path.dirname(__file__)
+sys.path.insert(0, _SCRIPTS_DIR)
+sys.path.insert(0, os.path.join(_SCRIPTS_DIR, "internal"))
 
 
 def start_modelsim_server():
     """Start ModelSim GUI with socket server only."""
+    from modelsim_controller import ModelSimController, get_project_root
+    from modelsim_paths import find_modelsim_exe
 
-    # Get project root and paths
-    project_root = Path.cwd()
+    # Get project root and paths (honors MODELSIM_PROJECT_ROOT)
+    project_root = get_project_root()
     sim_dir = project_root / "sim"
     # TCL server script is in the SKILL internal directory
     skill_scripts_dir = Path(__file__).parent
     tcl_server_script = skill_scripts_dir / "internal" / "modelsim_socket_server.tcl"
 
-    # ModelSim path
-    MODELSIM_DEFAULT_PATH = "C:/intelFPGA/20.1/modelsim_ase/win32aloem"
-    modelsim_bin = Path(MODELSIM_DEFAULT_PATH)
-    vsim_exe = modelsim_bin / "vsim.exe"
+    # ModelSim path (cached lookup shared with view_waveform.py)
+    vsim_exe = find_modelsim_exe("vsim.exe")
 
-    if not vsim_exe.exists():
-        print(f"✗ Error: ModelSim not found at {vsim_exe}")
-        print("Please update MODELSIM_DEFAULT_PATH in this script.")
+    if vsim_exe is None:
+        print("✗ Error: ModelSim vsim.exe not found")
+        print("Please update MODELSIM_DEFAULT_PATH in internal/modelsim_paths.py.")
         return False
 
     # Ensure sim directory exists
     sim_dir.mkdir(exist_ok=True)
 
-    print("="*60)
-    print("ModelSim GUI + Socket Server Startup")
-    print("="*60)
-    print(f"Project root: {project_root}")
-    print(f"Working directory: {sim_dir}")
-    print(f"Socket server: localhost:12345")
-    print("")
-
-    print("Starting ModelSim GUI...")
-    print("This will:")
-    print("  1. Open ModelSim GUI")
-    print("  2. Start socket server on port 12345")
-    print("  3. Wait for design to be loaded")
-    print("")
-
-    # Build command (convert path to forward slashes for TCL)
-    tcl_script_path = str(tcl_server_script).replace("\\", "/")
+    # Banners are emitted as single writes: one WriteFile to the
+    # console per block instead of a flush per line
+    sys.stdout.write(
+        f"{'='*60}\n"
+        "ModelSim GUI + Socket Server Startup\n"
+        f"{'='*60}\n"
+        f"Project root: {project_root}\n"
+        f"Working directory: {sim_dir}\n"
+        "Socket server: localhost:12345\n"
+        "\n"
+        "Starting ModelSim GUI...\n"
+        "This will:\n"
+        "  1. Open ModelSim GUI\n"
+        "  2. Start socket server on port 12345\n"
+        "  3. Wait for design to be loaded\n"
+        "\n")
+
+    # Build command (as_posix gives TCL its forward slashes directly)
+    tcl_script_path = tcl_server_script.as_posix()
     cmd = [
         str(vsim_exe),
         "-gui",
         "-do", f"source {tcl_script_path}; start_socket_server 12345"
     ]
 
-    print(f"Executing: {' '.join(cmd)}")
-    print(f"Working directory: {sim_dir}")
-    print("")
+    # Launch details are debug-only: the joined command line is just
+    # string churn nobody reads on a normal start
+    if "--verbose" in sys.argv:
+        print(f"Executing: {' '.join(cmd)}")
+        print(f"Working directory: {sim_dir}")
+        print("")
 
     try:
-        # Launch ModelSim
+        # Launch ModelSim. stdout/stderr go to DEVNULL: nothing ever
+        # reads these pipes, and a filled 64 KB pipe buffer would block
+        # vsim mid-run. The GUI logs to sim/transcript anyway.
         process = subprocess.Popen(
             cmd,
             cwd=str(sim_dir),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             creationflags=subprocess.CREATE_NEW_CONSOLE if sys.platform == 'win32' else 0
         )
 
         print(f"✓ ModelSim GUI launched (PID: {process.pid})")
         print("")
-        print("Waiting for socket server to start (up to 10 seconds)...")
-
-        # Test connection with retry (10-second timeout)
+        print("Waiting for socket server to start (up to ~10 seconds)...")
+
+        # Test connection with retry. The client backs off
+        # exponentially from 50 ms, so a server that comes up in a few
+        # hundred ms is detected almost immediately; capping the
+        # backoff at 0.5 s keeps the later probes frequent, and the
+        # retry sleeps sum to ~9.3 s (~11.6 s with worst-case 25%
+        # jitter), matching the printed "~10 seconds"
         controller = ModelSimController(project_root)
-        if controller.connect(max_retries=20, retry_delay=0.5):
+        if controller.connect(max_retries=22, retry_delay=0.05, max_delay=0.5):
             controller.disconnect()  # We just tested connection, disconnect
             print("✓ Socket server is ready")
         else:
             print("✗ Socket server failed to start within timeout")
             return False
 
-        print("")
-        print("="*60)
-        print("✓ ModelSim is ready!")
-        print("="*60)
-        print("")
-        print("ModelSim GUI Status:")
-        print("  - GUI window is open")
-        print("  - Socket server is running on port 12345")
-        print("  - No design loaded yet")
-        print("")
-        print("Next steps:")
-        print("  1. Load a design:")
-        print("     python scripts/load_module.py hdl/design/counter.v hdl/testbench/counter_tb.v counter_tb 1us")
-        print("")
-        print("  2. Or use switch_module.py to load a different design:")
-        print("     python scripts/switch_module.py hdl/design/new.v hdl/testbench/new_tb.v new_tb 1us")
-        print("")
-        print("ModelSim GUI will remain open. Close it manually when done.")
-        print("")
+        sys.stdout.write(
+            "\n"
+            f"{'='*60}\n"
+            "✓ ModelSim is ready!\n"
+            f"{'='*60}\n"
+            "\n"
+            "ModelSim GUI Status:\n"
+            "  - GUI window is open\n"
+            "  - Socket server is running on port 12345\n"
+            "  - No design loaded yet\n"
+            "\n"
+            "Next steps:\n"
+            "  1. Load a design:\n"
+            "     python scripts/load_module.py hdl/design/counter.v hdl/testbench/counter_tb.v counter_tb 1us\n"
+            "\n"
+            "  2. Or use switch_module.py to load a different design:\n"
+            "     python scripts/switch_module.py hdl/design/new.v hdl/testbench/new_tb.v new_tb 1us\n"
+            "\n"
+            "ModelSim GUI will remain open. Close it manually when done.\n"
+            "\n")
+        sys.stdout.flush()
 
         return True
 
     except Exception as e:
         print(f"✗ Failed to start ModelSim: {e}")
+        _print_traceback_if_verbose()
+        return False
+
+
+def _print_traceback_if_verbose():
+    """
+    Print the current traceback only when debugging was asked for.
+
+    Formatting a traceback walks frames and reads source lines off disk;
+    by default the one-line error is enough and arrives faster. Enable
+    with --verbose or MODELSIM_DEBUG=1.
+    """
+    if os.environ.get("MODELSIM_DEBUG") or "--verbose" in sys.argv:
         import traceback
         traceback.print_exc()
-        return False
 
 
 def main():
@@ -135,8 +161,7 @@ def main():
         sys.exit(0 if success else 1)
     except Exception as e:
         print(f"\n✗ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        _print_traceback_if_verbose()
         sys.exit(1)
 
 
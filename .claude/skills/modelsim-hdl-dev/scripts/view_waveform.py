@@ -2,13 +2,18 @@
 ModelSim波形ビューアを起動するスクリプト
 """
 
-import os
 import subprocess
+import sys
 from pathlib import Path
 import glob
 
+# Import from same directory
+sys.path.insert(0, str(Path(__file__).parent / "internal"))
+from modelsim_paths import MODELSIM_DEFAULT_PATH, find_modelsim_exe
+from modelsim_controller import get_project_root
 
-def view_waveform(waveform_file: str = None, modelsim_path: str = "C:/intelFPGA/20.1/modelsim_ase/win32aloem", auto_add_signals: bool = True):
+
+def view_waveform(waveform_file: str = None, modelsim_path: str = MODELSIM_DEFAULT_PATH, auto_add_signals: bool = True):
     """
     ModelSim GUIで波形ファイルを開く
 
@@ -17,24 +22,23 @@ def view_waveform(waveform_file: str = None, modelsim_path: str = "C:/intelFPGA/
         modelsim_path: ModelSimのインストールディレクトリ
         auto_add_signals: すべての信号を自動的に追加するかどうか
     """
-    project_root = Path.cwd()
+    project_root = get_project_root()
     waveforms_dir = project_root / "results" / "waveforms"
     scripts_dir = project_root / "scripts"
-    modelsim_exe = Path(modelsim_path) / "modelsim.exe"
-
-    # ModelSimが存在するか確認
-    if not modelsim_exe.exists():
-        print(f"ERROR: ModelSim not found at {modelsim_exe}")
+    # ModelSimが存在するか確認（検索結果はプロセス内でキャッシュされる）
+    modelsim_exe = find_modelsim_exe("modelsim.exe", modelsim_path)
+    if modelsim_exe is None:
+        print(f"ERROR: ModelSim not found at {Path(modelsim_path) / 'modelsim.exe'}")
         return False
 
     # 波形ファイルを決定
     if waveform_file is None:
-        # 最新の波形ファイルを探す
-        wlf_files = sorted(waveforms_dir.glob("sim_*.wlf"), reverse=True)
-        if not wlf_files:
+        # 最新の波形ファイルを探す（sim_YYYYMMDD_… の名前順 = 時刻順
+        # なので、全件ソートせず max で一回走査するだけでよい）
+        waveform_file = max(waveforms_dir.glob("sim_*.wlf"), default=None)
+        if waveform_file is None:
             print("ERROR: No waveform files found")
             return False
-        waveform_file = wlf_files[0]
     else:
         waveform_file = Path(waveform_file)
 
@@ -49,25 +53,23 @@ def view_waveform(waveform_file: str = None, modelsim_path: str = "C:/intelFPGA/
     cmd = [
         str(modelsim_exe),
         "-view",
-        str(waveform_file).replace("\\", "/")
+        waveform_file.as_posix()
     ]
 
     # 自動的に信号を追加する場合、TCLスクリプトを指定
     if auto_add_signals:
         view_wave_tcl = scripts_dir / "view_wave.tcl"
         if view_wave_tcl.exists():
-            cmd.extend(["-do", str(view_wave_tcl).replace("\\", "/")])
+            cmd.extend(["-do", view_wave_tcl.as_posix()])
             print("Auto-adding all signals to wave window...")
 
     try:
-        # 環境変数にModelSimのパスを追加
-        env = os.environ.copy()
-        env['PATH'] = str(Path(modelsim_path)) + os.pathsep + env.get('PATH', '')
-
         # バックグラウンドでGUIを起動
+        # 絶対パスで起動するので PATH への追加（os.environ 全体の
+        # コピー）は不要 — ModelSim は自分のインストールディレクトリ
+        # から DLL を解決する
         process = subprocess.Popen(
             cmd,
-            env=env,
             cwd=str(project_root / "sim")
         )
 
@@ -87,7 +89,7 @@ def view_waveform(waveform_file: str = None, modelsim_path: str = "C:/intelFPGA/
 
 def list_waveforms():
     """利用可能な波形ファイルを一覧表示"""
-    project_root = Path.cwd()
+    project_root = get_project_root()
     waveforms_dir = project_root / "results" / "waveforms"
 
     wlf_files = sorted(waveforms_dir.glob("sim_*.wlf"), reverse=True)
@@ -103,8 +105,6 @@ def list_waveforms():
 
 
 if __name__ == "__main__":
-    import sys
-
     if len(sys.argv) > 1:
         if sys.argv[1] == "--list":
             list_waveforms()
@@ -5,12 +5,12 @@ Adjust waveform zoom level.
 Self-contained zoom control using controller infrastructure only.
 """
 
+import os
 import sys
-from pathlib import Path
 
-# Import from same directory
-sys.path.insert(0, str(Path(__file__).parent / "internal"))
-from modelsim_controller import ModelSimController
+# Import from same directory (controller import itself is deferred to
+# main() so usage errors never pay for it)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "internal"))
 
 
 def main():
@@ -28,10 +28,12 @@ def main():
         print('  python zoom_waveform.py "1us" "2us"')
         sys.exit(1)
 
+    from modelsim_controller import ModelSimController, get_project_root
+
     mode = sys.argv[1].lower()
 
-    # Get project root from current working directory
-    project_root = Path.cwd()
+    # Project root honors MODELSIM_PROJECT_ROOT (defaults to the CWD)
+    project_root = get_project_root()
 
     try:
         # Create controller
@@ -55,7 +57,7 @@ def main():
             print("✗ ERROR: Invalid arguments")
             print("  For range zoom, provide both start and end times")
             print('  Example: python zoom_waveform.py "100ns" "500ns"')
-            controller.disconnect()
+            # Process exit closes the socket; no teardown round-trip
             sys.exit(1)
 
         # Execute command
@@ -66,8 +68,7 @@ def main():
 
         # Check result
         if result['success']:
-            print()
-            print("✓ SUCCESS: Waveform zoom adjusted")
+            sys.stdout.write("\n✓ SUCCESS: Waveform zoom adjusted\n")
             sys.exit(0)
         else:
             print()
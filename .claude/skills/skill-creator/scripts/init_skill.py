@@ -328,6 +328,27 @@ public class Example{class_name}Editor : EditorWindow
 }}
 """
 
+UNITY_EXAMPLE_REFERENCE = """# {skill_title} Operations
+
+## Operation Reference
+
+[TODO: Document your operations here]
+
+### operation_name
+
+**Description:** What this operation does
+
+**Parameters:**
+| Parameter | Type | Required | Description |
+|-----------|------|----------|-------------|
+| param1 | string | Yes | Description |
+
+**Example:**
+```json
+{{"operation": "operation_name", "params": {{"param1": "value"}}}}
+```
+"""
+
 UNITY_EXAMPLE_TEMPLATE = """// Example template script for {skill_name}
 // Users can copy this to their project and modify as needed
 
@@ -446,26 +467,8 @@ def init_unity_skill(skill_name, path):
         references_dir = skill_dir / 'references'
         references_dir.mkdir(exist_ok=True)
         example_reference = references_dir / 'operations.md'
-        example_reference.write_text(f"""# {skill_title} Operations
-
-## Operation Reference
-
-[TODO: Document your operations here]
-
-### operation_name
-
-**Description:** What this operation does
-
-**Parameters:**
-| Parameter | Type | Required | Description |
-|-----------|------|----------|-------------|
-| param1 | string | Yes | Description |
-
-**Example:**
-```json
-{{"operation": "operation_name", "params": {{"param1": "value"}}}}
-```
-""")
+        example_reference.write_text(
+            UNITY_EXAMPLE_REFERENCE.format(skill_title=skill_title))
         print("Created references/operations.md")
 
     except Exception as e: